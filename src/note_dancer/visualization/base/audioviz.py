@@ -1,4 +1,5 @@
-import collections
+import math
+import operator
 import os
 import sys
 import time
@@ -15,7 +16,8 @@ from note_dancer.visualization.base.parameters import (
     NumericParameter,
     SpectrumGainParameter,
 )
-from note_dancer.visualization.base.receiver import AudioReceiver
+from note_dancer.visualization.base.receiver import AudioPacket, AudioReceiver
+from note_dancer.visualization.base.ring_buffer import RingBuffer
 
 LOGICAL_RESOLUTION: tuple[int, int] = (
     1920,
@@ -23,6 +25,29 @@ LOGICAL_RESOLUTION: tuple[int, int] = (
 )  # (1920, 1080)  # will be upscaled if required, much less load for CPU
 os.environ["SDL_RENDER_SCALE_QUALITY"] = "2"  # upscaling quality (0-2)
 
+# Reads the six attack/decay slider values of a visualization in a single C-level call
+_get_band_envelopes = operator.attrgetter(
+    "low_atk.value", "low_dcy.value", "mid_atk.value", "mid_dcy.value", "high_atk.value", "high_dcy.value"
+)
+
+
+def lerp_band(current: float, target: float, attack: float, decay: float) -> float:
+    """
+    Asymmetric smoothing step for a single frequency band.
+
+    Args:
+        current: The current smoothed value.
+        target: The new raw value.
+        attack: Smoothing factor used while the signal is rising.
+        decay: Smoothing factor used while the signal is falling.
+
+    Returns:
+        The new smoothed value.
+    """
+    # Choose alpha based on whether signal is rising (Attack) or falling (Decay)
+    alpha = attack if target > current else decay
+    return current + (target - current) * alpha
+
 
 class AudioVisualizationBase:
     def __init__(self) -> None:
@@ -39,7 +64,7 @@ class AudioVisualizationBase:
         self.hud = HUD()
         self.debug_overlay = DebugOverlay()
         self.clock = pygame.time.Clock()
-        self.last_frame_time = time.time()
+        self.last_frame_time = time.monotonic_ns()
 
         # --- 1. Audio Parameters (Gains & Thresholds) ---
         self.flux_thr = self.hud.register(EngineParameter("norm_mode", 0, 0, 2, 1, category="global"))
@@ -71,13 +96,13 @@ class AudioVisualizationBase:
 
         # --- 3. State Management (Crucial for History & Smoothing) ---
         # History for the Flux Sparkline (200 frames)
-        self.flux_history = collections.deque([0.0] * 200, maxlen=200)
+        self.flux_history = RingBuffer(200, prefilled=True)
 
         # Latest chroma note energies
         self.notes = [0.0] * 12
 
         # Storage for the most recent raw packet
-        self.data = {}
+        self.data = AudioPacket()
 
         # Accumulators for the Triple-Band Smoothing
         self.smooth_low = 0.0
@@ -134,21 +159,30 @@ class AudioVisualizationBase:
             pygame.display.flip()
             self.clock.tick(60)
 
+        # Preset writes run in the background, make sure the last one is on disk before exiting
+        self.hud.flush_saves()
         pygame.quit()
         sys.exit()
 
     def _hedge_bpm(self, raw_bpm):
         """Force BPM into 90-180 range (The Hedging you requested)."""
-        if raw_bpm <= 0:
+        # Non-finite values (NaN/inf from a corrupt packet) would make the log2/ldexp math below raise
+        if not math.isfinite(raw_bpm) or raw_bpm <= 0:
             return 120.0
-        temp_bpm = raw_bpm
-        # Keep doubling until it hits the floor
-        while temp_bpm < 90:
-            temp_bpm *= 2
-        # Keep halving until it hits the ceiling
-        while temp_bpm > 180:
-            temp_bpm /= 2
-        return temp_bpm
+        # Closed form of "keep doubling until it hits the floor, keep halving until it hits the ceiling":
+        # the number of octaves to shift is known from the log2 distance to either bound
+        # (log2 differences instead of log2 of a ratio, 90 / raw_bpm overflows for subnormal input)
+        log_bpm = math.log2(raw_bpm)
+        octaves = max(0, math.ceil(math.log2(90.0) - log_bpm)) - max(0, math.ceil(log_bpm - math.log2(180.0)))
+        bpm = math.ldexp(raw_bpm, octaves)
+        # log2 rounding can be one octave off right at a bound, a single correction step fixes it. An exact
+        # 90/180 hit counts as off too when the loops could not have stopped there (halving ends in (90, 180],
+        # doubling in [90, 180))
+        if bpm < 90.0 or (bpm == 90.0 and raw_bpm > 180.0):
+            bpm *= 2
+        elif bpm > 180.0 or (bpm == 180.0 and raw_bpm < 90.0):
+            bpm /= 2
+        return bpm
 
     def handle_keys(self, key: int) -> None:
         self.hud.handle_input(key)
@@ -164,36 +198,34 @@ class AudioVisualizationBase:
 
         # --- 1. Core State Update ---
         self.data = packet
-        self.flux_history.append(packet["flux"])
-        self.notes = packet["notes"]
+        self.flux_history.push(packet.flux)
+        self.notes = packet.notes
 
         # --- 2. BPM Hedging & Smoothing ---
         # Forces BPM into 90-180 range and drifts the value smoothly
-        target_bpm = self._hedge_bpm(packet["bpm"])
+        target_bpm = self._hedge_bpm(packet.bpm)
         self.smooth_bpm += (target_bpm - self.smooth_bpm) * 0.1
 
         # --- 3. Per-Band Asymmetric Smoothing ---
-        def lerp_band(current, target, atk_param, dcy_param):
-            # Choose alpha based on whether signal is rising (Attack) or falling (Decay)
-            alpha = atk_param.value if target > current else dcy_param.value
-            return current + (target - current) * alpha
-
-        # Smooth each band using its specific HUD sliders
-        self.smooth_low = lerp_band(self.smooth_low, packet["low"], self.low_atk, self.low_dcy)
-        self.smooth_mid = lerp_band(self.smooth_mid, packet["mid"], self.mid_atk, self.mid_dcy)
-        self.smooth_high = lerp_band(self.smooth_high, packet["high"], self.high_atk, self.high_dcy)
+        # Smooth each band using its specific HUD sliders (all six read in one go)
+        low_atk, low_dcy, mid_atk, mid_dcy, high_atk, high_dcy = _get_band_envelopes(self)
+        self.smooth_low = lerp_band(self.smooth_low, packet.low, low_atk, low_dcy)
+        self.smooth_mid = lerp_band(self.smooth_mid, packet.mid, mid_atk, mid_dcy)
+        self.smooth_high = lerp_band(self.smooth_high, packet.high, high_atk, high_dcy)
 
         # --- 4. Event Assembly ---
-        peak_note = max(self.notes) if any(self.notes) else 1.0
+        # A single scan for the peak (an all-silent frame falls back to 1.0), and the gate is computed once
+        peak_note = max(self.notes) or 1.0
+        note_gate = peak_note * self.note_sens.value
 
         return {
-            "beat": packet["is_beat"] > 0.5,
-            "impact": packet["flux"] > self.flux_thr.value,
+            "beat": packet.is_beat,
+            "impact": packet.flux > self.flux_thr.value,
             "low": self.smooth_low,
             "mid": self.smooth_mid,
             "high": self.smooth_high,
             "bpm": self.smooth_bpm,
-            "active_notes": [i for i, v in enumerate(self.notes) if v >= (peak_note * self.note_sens.value)],
+            "active_notes": [i for i, v in enumerate(self.notes) if v >= note_gate],
         }
 
     def draw(self, screen: pygame.Surface, font: pygame.font.Font) -> None:
@@ -201,8 +233,9 @@ class AudioVisualizationBase:
         The Master Draw Method.
         Now feeds expanded data to the HUD for better visualizations.
         """
-        frame_time_ms = (time.time() - self.last_frame_time) * 1000.0
-        self.last_frame_time = time.time()
+        now = time.monotonic_ns()
+        frame_time_ms = (now - self.last_frame_time) * 1e-6
+        self.last_frame_time = now
 
         # 1. Execute the 'Art' (Subclass logic)
         self.render_visualization(screen, font)
@@ -210,22 +243,24 @@ class AudioVisualizationBase:
         # 2. Assemble the "Signal Chain" context for the HUD
         # This is what the parameters use to draw their mini-graphs
         context = {
-            "flux_history": self.flux_history,
+            "flux_history": self.flux_history.view(),
             "prev_energies": self.notes,
             # Smoothed Values
             "low": self.smooth_low,
             "mid": self.smooth_mid,
             "high": self.smooth_high,
             # Raw Hits
-            "raw_low": self.data.get("low", 0.0),
-            "raw_mid": self.data.get("mid", 0.0),
-            "raw_high": self.data.get("high", 0.0),
-            "is_beat": self.data.get("is_beat", 0),
-            "flux": self.data.get("flux", 0),
+            "raw_low": self.data.low,
+            "raw_mid": self.data.mid,
+            "raw_high": self.data.high,
+            "is_beat": self.data.is_beat,
+            "flux": self.data.flux,
         }
 
         # 3. Draw the HUD (passes context to all parameters)
-        self.hud.draw(screen, font, audio_state=context, fps=self.clock.get_fps())
+        # The FPS readout is part of the HUD, so only query the clock while the HUD is shown
+        fps = self.clock.get_fps() if self.hud.show_help else 0.0
+        self.hud.draw(screen, font, audio_state=context, fps=fps)
 
         # 4. Update and draw debug overlay
         if self.debug_overlay.visible:
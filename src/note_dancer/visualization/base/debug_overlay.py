@@ -5,12 +5,12 @@ Displays network health, rendering performance, sync metrics, and data quality.
 Toggled with 'D' key, positioned in top-right corner to avoid HUD overlap.
 """
 
-from collections import deque
-from typing import Any
-
 import numpy as np
 import pygame
 
+from note_dancer.visualization.base.receiver import AudioPacket
+from note_dancer.visualization.base.ring_buffer import RingBuffer
+
 
 class DebugOverlay:
     """
@@ -42,8 +42,8 @@ class DebugOverlay:
     def __init__(self):
         """Initialize debug overlay tracking."""
         self.visible = False
-        self.frame_times = deque(maxlen=60)
-        self.packets_drained_counts = deque(maxlen=60)  # Packets drained per frame
+        self.frame_times = RingBuffer(60, dtype=np.float64)
+        self.packets_drained_counts = RingBuffer(60, dtype=np.int64)  # Packets drained per frame
         self.packet_count = 0
         self.data_errors = 0
         self.socket_errors = 0
@@ -54,7 +54,7 @@ class DebugOverlay:
         self,
         frame_time_ms: float,
         packets_drained: int,
-        data: dict[str, Any],
+        data: AudioPacket,
         active_traces: int,
         cache_size: int,
     ) -> None:
@@ -66,18 +66,18 @@ class DebugOverlay:
             packets_drained: Number of packets drained from buffer this frame.
             data: Latest packet data.
             active_traces: Number of active note traces.
-            cache_size: Size of NoteTrace cache.
+            cache_size: Size of NoteTraces sprite cache.
         """
-        self.frame_times.append(frame_time_ms)
-        self.packets_drained_counts.append(packets_drained)
+        self.frame_times.push(frame_time_ms)
+        self.packets_drained_counts.push(packets_drained)
         self.packet_count += 1
         self.active_traces_count = active_traces
         self.cache_size = cache_size
 
         # Check for data validity
         try:
-            notes = data.get("notes", [])
-            bpm = data.get("bpm", 0)
+            notes = data.notes
+            bpm = data.bpm
 
             # Validate note range
             if notes and (any(n < 0 or n > 1 for n in notes)):
@@ -106,21 +106,21 @@ class DebugOverlay:
 
         # Calculate rendering metrics
         if self.frame_times:
-            render_fps = 1000.0 / np.mean(self.frame_times)
-            avg_frame_time = np.mean(self.frame_times)
+            avg_frame_time = float(self.frame_times.view().mean())
+            render_fps = 1000.0 / avg_frame_time if avg_frame_time > 0 else 0.0
         else:
             render_fps = 0.0
             avg_frame_time = 0.0
 
         # Calculate backend/packet metrics
-        if self.packets_drained_counts and len(self.packets_drained_counts) > 0:
-            total_packets = sum(self.packets_drained_counts)
-            avg_packets_per_frame = total_packets / len(self.packets_drained_counts)
+        if self.packets_drained_counts:
+            drained = self.packets_drained_counts.view()
+            avg_packets_per_frame = float(drained.mean())
             # Backend FPS estimate: (total packets drained / num frames) * render FPS
             backend_fps = avg_packets_per_frame * render_fps
             # Data reuse: frames with 0 packets = frame used prior data
-            frames_with_zero_packets = sum(1 for count in self.packets_drained_counts if count == 0)
-            data_reuse_pct = (frames_with_zero_packets / len(self.packets_drained_counts)) * 100.0
+            frames_with_zero_packets = np.count_nonzero(drained == 0)
+            data_reuse_pct = (frames_with_zero_packets / len(drained)) * 100.0
         else:
             backend_fps = 0.0
             avg_packets_per_frame = 0.0
@@ -1,12 +1,15 @@
 import json
 import os
-import time
+import threading
+from collections.abc import Callable
 
 import pygame
 
 from note_dancer.visualization.base.parameters_base import (
     BooleanParameter,
+    EngineParameter,
     NumericParameter,
+    ParameterBase,
     ParameterContainer,
 )
 
@@ -18,134 +21,288 @@ class HUD:
         self.selected_idx = 0
         self.active_category = "local"
         self.categories = ["local", "physics", "global"]
+        self._by_category: dict[str, list] = {cat: [] for cat in self.categories}
+        # Preset snapshot key -> parameters: (name,) for plain parameters, (container name, name) for children.
+        # Names don't have to be unique, a snapshot value is applied to every parameter registered under its key.
+        self._preset_targets: dict[tuple[str, ...], list[ParameterBase]] = {}
         self.show_help = True  # Changed to True for testing visibility
-        self.help_timer = time.time() + 3600  # Long timer for dev
+        self.help_timer = pygame.time.get_ticks() + 3_600_000  # Long timer for dev (ms)
         self.msg = ""
-        self.msg_timer = 0
+        self.msg_timer = 0  # ms, compared against pygame.time.get_ticks()
+        self._now = 0  # Tick count of the current frame, taken once at the top of draw()
+        self._surface_size = (0, 0)  # Size of the target surface of the current frame, also taken once in draw()
         self.preset_slots: dict[str, None | dict] = {str(i): None for i in range(10)}  # Keys '0' through '9'
         self.preset_file = "user_presets.json"
         self.preset_slots = self._load_from_disk()
 
+        # Preset file writes happen on a background thread, rapid saves are coalesced into one write.
+        # Pending saves hold (slot, payload), the status message is handed back to draw() once written.
+        self._save_lock = threading.Lock()
+        self._pending_save: tuple[str, str] | None = None
+        self._save_thread: threading.Thread | None = None
+        self._save_result_msg: str | None = None
+
+        # Rendered text surfaces keyed by (font, text, color), labels only change when a value is adjusted
+        self._text_cache: dict[tuple, pygame.Surface] = {}
+        self._text_cache_max_size = 512
+
+        # Composed panel backgrounds + labels per category, only rebuilt after a value, selection or category change
+        self._panel_cache: dict[str, pygame.Surface] = {}
+        self._panel_dirty: dict[str, bool] = {cat: True for cat in self.categories}
+        # Per category: (layout key, [(visual, graph rect), ...]) for the live parameter visuals
+        self._visual_layouts: dict[str, tuple] = {}
+
+        # Preset slot strip, only rebuilt when a slot gets saved
+        self._presets_surf: pygame.Surface | None = None
+
+        # FPS readout is refreshed a few times per second instead of on every frame
+        self._fps_img: pygame.Surface | None = None
+        self._fps_last_update = 0
+        self._fps_update_interval = 250  # ms
+
+        # Key -> action on the active category's parameter list, one dict lookup per keypress
+        self._key_actions: dict[int, Callable[[list], None]] = {
+            pygame.K_UP: lambda view: self._move_selection(view, -1),
+            pygame.K_DOWN: lambda view: self._move_selection(view, 1),
+            pygame.K_TAB: lambda view: self._next_category(),
+            pygame.K_RIGHT: lambda view: self._adjust_selected(view, 1),
+            pygame.K_LEFT: lambda view: self._adjust_selected(view, -1),
+            pygame.K_RETURN: self._toggle_selected,
+            pygame.K_SPACE: self._toggle_selected,
+        }
+
+        # Top-level key -> handler table: 'H', the preset slots 0-9 and the parameter actions above
+        self._key_handlers: dict[int, Callable[[int], None]] = dict.fromkeys(self._key_actions, self._parameter_key)
+        self._key_handlers.update(dict.fromkeys(range(pygame.K_0, pygame.K_9 + 1), self._preset_key))
+        self._key_handlers[pygame.K_h] = self._toggle_help
+
+    def _render_text(self, font: pygame.font.Font, text: str, color: tuple) -> pygame.Surface:
+        """
+        Returns the antialiased text surface, rendering it only on the first request.
+
+        Args:
+            font: The font to render with.
+            text: The text to render.
+            color: The RGB text color.
+
+        Returns:
+            The (cached) text surface.
+        """
+        key = (font, text, color)
+        text_surf = self._text_cache.get(key)
+        if text_surf is None:
+            text_surf = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = text_surf
+            # Simple FIFO eviction, the steady-state working set is far below the limit
+            if len(self._text_cache) > self._text_cache_max_size:
+                del self._text_cache[next(iter(self._text_cache))]
+        return text_surf
+
+    def _mark_panels_dirty(self) -> None:
+        """Forces every panel to be re-composed on its next draw."""
+        for cat in self._panel_dirty:
+            self._panel_dirty[cat] = True
+
     def register(self, p):
         self.registry.append(p)
-        self._rebuild_selection_list()
+        self._append_to_selection_list(p)
+        self._mark_panels_dirty()
         return p
 
     def _rebuild_selection_list(self) -> None:
+        """Rebuilds the selection list from scratch (only needed if the registry gets reordered/shrunk)."""
         self.params = []
+        self._by_category = {cat: [] for cat in self.categories}
+        self._preset_targets = {}
         for item in self.registry:
-            if isinstance(item, ParameterContainer):
-                for sub in item.get_items():
-                    self.params.append(sub)
-            else:
-                if not hasattr(item, "owner"):
-                    item.owner = None
-                self.params.append(item)
+            self._append_to_selection_list(item)
+
+    def _append_to_selection_list(self, item) -> None:
+        """Adds a newly registered parameter (or the children of a container) to the selection list."""
+        if isinstance(item, ParameterContainer):
+            new_params = item.get_items()
+            for sub in new_params:
+                self._preset_targets.setdefault((item.name, sub.name), []).append(sub)
+        else:
+            if not hasattr(item, "owner"):
+                item.owner = None
+            new_params = [item]
+            self._preset_targets.setdefault((item.name,), []).append(item)
+
+        for p in new_params:
+            self.params.append(p)
+            # Bucket by category once, so drawing and input don't have to filter the full list
+            self._by_category.setdefault(p.category, []).append(p)
 
     def handle_input(self, key: int) -> None:
-        # Toggle HUD visibility with 'H'
-        if key == pygame.K_h:
-            self.show_help = not self.show_help
-            self.help_timer = time.time() + 60
+        handler = self._key_handlers.get(key)
+        # Only 'H' is processed while the HUD is hidden
+        if handler is not None and (self.show_help or key == pygame.K_h):
+            handler(key)
 
-        # Only process further input if HUD is visible
-        if not self.show_help:
+    def _toggle_help(self, key: int) -> None:
+        # Toggle HUD visibility with 'H'
+        self.show_help = not self.show_help
+        self.help_timer = pygame.time.get_ticks() + 60_000
+
+    def _preset_key(self, key: int) -> None:
+        # Preset Logic: Ctrl + 0-9 saves, 0-9 loads
+        slot = str(key - pygame.K_0)  # Digit keycodes are contiguous, no need to ask SDL for the key name
+        if pygame.key.get_mods() & pygame.KMOD_CTRL:
+            self._save_preset(slot)
+        else:
+            self._load_preset(slot)
+
+    def _parameter_key(self, key: int) -> None:
+        current_view = self._by_category[self.active_category]
+        if not current_view:
             return
 
-        # Preset Logic
-        mods = pygame.key.get_mods()
-        is_ctrl = mods & pygame.KMOD_CTRL
-
-        # Check for keys 0-9
-        if pygame.K_0 <= key <= pygame.K_9:
-            slot = pygame.key.name(key)
-            if is_ctrl:
-                self._save_preset(slot)
-            else:
-                self._load_preset(slot)
-            return  # Exit early so we don't trigger other HUD actions
+        self._key_actions[key](current_view)
+        # The action may have changed the selection, the category or a label
+        self._mark_panels_dirty()
 
-        current_view = [p for p in self.params if p.category == self.active_category]
-        if not current_view:
-            return
+    def _move_selection(self, view: list, step: int) -> None:
+        self.selected_idx = (self.selected_idx + step) % len(view)
 
-        if key == pygame.K_UP:
-            self.selected_idx = (self.selected_idx - 1) % len(current_view)
-        elif key == pygame.K_DOWN:
-            self.selected_idx = (self.selected_idx + 1) % len(current_view)
-        elif key == pygame.K_TAB:
-            cat_idx = (self.categories.index(self.active_category) + 1) % len(self.categories)
-            self.active_category = self.categories[cat_idx]
-            self.selected_idx = 0
+    def _next_category(self) -> None:
+        cat_idx = (self.categories.index(self.active_category) + 1) % len(self.categories)
+        self.active_category = self.categories[cat_idx]
+        self.selected_idx = 0
 
-        target = current_view[self.selected_idx]
+    def _adjust_selected(self, view: list, direction: int) -> None:
+        target = view[self.selected_idx]
         if isinstance(target, NumericParameter):
-            if key == pygame.K_RIGHT:
-                target.adjust(1)
-            elif key == pygame.K_LEFT:
-                target.adjust(-1)
-        elif isinstance(target, BooleanParameter):
-            if key in [pygame.K_RETURN, pygame.K_SPACE]:
-                target.toggle()
+            target.adjust(direction)
+
+    def _toggle_selected(self, view: list) -> None:
+        target = view[self.selected_idx]
+        if isinstance(target, BooleanParameter):
+            target.toggle()
+
+    def _get_panel_background(self, category: str, size: tuple[int, int], alpha: int) -> pygame.Surface:
+        """
+        Returns the category's panel surface cleared to its translucent background.
+
+        Args:
+            category: The category the panel shows.
+            size: The panel size in pixels.
+            alpha: Opacity of the black background.
+
+        Returns:
+            The previously composed panel surface if the size still fits, otherwise a new one.
+        """
+        panel_surf = self._panel_cache.get(category)
+        if panel_surf is None or panel_surf.get_size() != size:
+            panel_surf = pygame.Surface(size, pygame.SRCALPHA)
+        panel_surf.fill((0, 0, 0, alpha))
+        return panel_surf
 
     def _render_panel_with_viz(self, surface, font, title, params, pos, color, audio_state, width=480):
-        # Determine selection context
-        current_view = [p for p in self.params if p.category == self.active_category]
-
         line_h = 32
-        box_h = 45 + (len(params) * line_h)
-        panel_surf = pygame.Surface((width, box_h), pygame.SRCALPHA)
-        panel_surf.fill((0, 0, 0, 180))
-        panel_surf.blit(font.render(title, True, color), (15, 10))
+        category = params[0].category
+
+        # Static part (background + labels) is composed once and reused until something changes
+        panel_surf = self._panel_cache.get(category)
+        if panel_surf is None or self._panel_dirty[category]:
+            # The panel of the active category shows the selection, params are in selection order
+            is_active = category == self.active_category
+
+            box_h = 45 + (len(params) * line_h)
+            panel_surf = self._get_panel_background(category, (width, box_h), 180)
+
+            # Title and labels are submitted with a single blits() call
+            blit_list = [(self._render_text(font, title, color), (15, 10))]
+            for i, p in enumerate(params):
+                # Selection & Label
+                is_selected = is_active and i == self.selected_idx
+                text_color = (255, 255, 255) if is_selected else color
+                prefix = "> " if is_selected else "  "
 
+                label_img = self._render_text(font, prefix + str(p), text_color)
+                blit_list.append((label_img, (15, 45 + (i * line_h))))
+            panel_surf.blits(blit_list, doreturn=False)
+
+            self._panel_cache[category] = panel_surf
+            self._panel_dirty[category] = False
+
+        surface.blit(panel_surf, pos)
+
+        # Dynamic part: the live visuals are drawn straight onto the target surface every frame
+        # Which visual goes into which rect only depends on the layout, so it is resolved once
+        layout_key = (pos, width, len(params))
+        cached_layout = self._visual_layouts.get(category)
+        if cached_layout is None or cached_layout[0] != layout_key:
+            cached_layout = (layout_key, self._layout_visuals(params, pos, width, line_h))
+            self._visual_layouts[category] = cached_layout
+
+        # Visuals draw into their graph rect of the target directly, the clip keeps them inside it
+        prev_clip = surface.get_clip()
+        for visual, graph_rect in cached_layout[1]:
+            surface.set_clip(graph_rect)
+            visual.draw_visual(surface, graph_rect, audio_state)
+        surface.set_clip(prev_clip)
+
+    def _layout_visuals(self, params, pos, width, line_h) -> list[tuple]:
+        """
+        Resolves the parameter visuals of a panel and their graph rects on the target surface.
+
+        Args:
+            params: The parameters (rows) of the panel.
+            pos: Top left corner of the panel on the target surface.
+            width: Panel width.
+            line_h: Row height.
+
+        Returns:
+            A list of (object with draw_visual, graph rect) pairs, in drawing order.
+        """
+        layout = []
         # Tracks grouped visuals (like Envelopes) to avoid double-drawing
         drawn_groups = set()
 
         for i, p in enumerate(params):
             y_off = 45 + (i * line_h)
 
-            # Selection & Label
-            is_selected = p in current_view and current_view.index(p) == self.selected_idx
-            text_color = (255, 255, 255) if is_selected else color
-            prefix = "> " if is_selected else "  "
-
-            label_img = font.render(prefix + str(p), True, text_color)
-            panel_surf.blit(label_img, (15, y_off))
-
             # --- VISUALIZATION LOGIC ---
             graph_w = 160
-            graph_rect = pygame.Rect(width - graph_w - 15, y_off + 2, graph_w, 22)
+            graph_rect = pygame.Rect(pos[0] + width - graph_w - 15, pos[1] + y_off + 2, graph_w, 22)
 
             # Check 1: Does this parameter belong to a Container (like Envelope)?
             visual_owner = getattr(p, "owner", None)
             if visual_owner and hasattr(visual_owner, "draw_visual"):
-                if visual_owner not in drawn_groups:
-                    sub = panel_surf.subsurface(graph_rect)
-                    visual_owner.draw_visual(sub, audio_state)
+                # Containers without their own visual only have the no-op base implementation
+                has_visual = type(visual_owner).draw_visual is not ParameterContainer.draw_visual
+                if has_visual and visual_owner not in drawn_groups:
+                    layout.append((visual_owner, graph_rect))
                     drawn_groups.add(visual_owner)
 
             # Check 2: Is this a specialized Standalone Parameter?
             # (FluxImpactParameter, ChromaSensitivityParameter, etc.)
             elif hasattr(p, "draw_visual"):
-                sub = panel_surf.subsurface(graph_rect)
-                p.draw_visual(sub, audio_state)
+                layout.append((p, graph_rect))
 
-        surface.blit(panel_surf, pos)
+        return layout
 
     def _render_panel(self, surface, font, title, params, pos, color):
-        current_view = [p for p in self.params if p.category == self.active_category]
-        line_h = 25
-        width = 400
-        bg_h = 35 + ((len(params) + 1) * line_h)
-        bg = pygame.Surface((width, bg_h), pygame.SRCALPHA)
-        bg.fill((0, 0, 0, 160))
-
-        bg.blit(font.render(title, True, color), (10, 10))
-        for i, p in enumerate(params):
-            is_selected = p in current_view and current_view.index(p) == self.selected_idx
-            text_color = (255, 255, 255) if is_selected else color
-            prefix = "> " if is_selected else "  "
-            bg.blit(font.render(prefix + str(p), True, text_color), (10, 40 + i * line_h))
+        category = params[0].category
+        bg = self._panel_cache.get(category)
+        if bg is None or self._panel_dirty[category]:
+            is_active = category == self.active_category
+            line_h = 25
+            width = 400
+            bg_h = 35 + ((len(params) + 1) * line_h)
+            bg = self._get_panel_background(category, (width, bg_h), 160)
+
+            blit_list = [(self._render_text(font, title, color), (10, 10))]
+            for i, p in enumerate(params):
+                is_selected = is_active and i == self.selected_idx
+                text_color = (255, 255, 255) if is_selected else color
+                prefix = "> " if is_selected else "  "
+                blit_list.append((self._render_text(font, prefix + str(p), text_color), (10, 40 + i * line_h)))
+            bg.blits(blit_list, doreturn=False)
+
+            self._panel_cache[category] = bg
+            self._panel_dirty[category] = False
         surface.blit(bg, pos)
 
     def _save_preset(self, slot: str):
@@ -157,9 +314,11 @@ class HUD:
                 snapshot[p.name] = p.value
 
         self.preset_slots[slot] = snapshot
-        self._save_to_disk()
+        self._presets_surf = None
+        self._save_to_disk(slot)
 
-        self._show_message(f"PRESET {slot} SAVED TO DISK")
+        # Replaced by the final status once the background write is done
+        self._show_message(f"SAVING PRESET {slot}...")
 
     def _load_preset(self, slot: str):
         """Applies a saved snapshot to the current parameters."""
@@ -167,28 +326,67 @@ class HUD:
         if not snapshot:
             return
 
-        for p in self.registry:
-            if isinstance(p, ParameterContainer) and p.name in snapshot:
-                container_data = snapshot[p.name]
-                for sub in p.get_items():
-                    if sub.name in container_data:
-                        sub.value = type(sub.value)(container_data[sub.name])
-            elif p.name in snapshot:
-                p.value = type(p.value)(snapshot[p.name])
+        # One pass over the snapshot, each entry resolves to its parameters with a single lookup
+        targets = self._preset_targets
+        for name, value in snapshot.items():
+            if isinstance(value, dict):
+                entries = [((name, sub_name), sub_value) for sub_name, sub_value in value.items()]
+            else:
+                entries = [((name,), value)]
 
+            for key, v in entries:
+                for p in targets.get(key, ()):
+                    p.value = type(p.value)(v)
+
+        self._mark_panels_dirty()
         self._show_message(f"PRESET {slot} LOADED")
 
     def _show_message(self, text):
         self.msg = text
-        self.msg_timer = time.time() + 2.0
+        self.msg_timer = pygame.time.get_ticks() + 2000
+
+    def _save_to_disk(self, slot: str):
+        """Queues the current preset_slots dictionary for writing to the JSON file (in the background)."""
+        # Serialize here, so the worker never sees the dict while it is being modified
+        payload = json.dumps(self.preset_slots, separators=(",", ":"))
+        with self._save_lock:
+            self._pending_save = (slot, payload)
+            if self._save_thread is None:
+                # Not a daemon, so an interpreter shutdown still waits for a write that is in flight
+                self._save_thread = threading.Thread(target=self._save_worker)
+                self._save_thread.start()
+
+    def flush_saves(self):
+        """Blocks until all queued preset writes are on disk, call this before quitting."""
+        with self._save_lock:
+            thread = self._save_thread
+        if thread is not None:
+            thread.join()
+
+    def _save_worker(self):
+        """Writes queued payloads until none is left, only the latest one of a burst of saves hits the disk."""
+        while True:
+            with self._save_lock:
+                pending = self._pending_save
+                self._pending_save = None
+                if pending is None:
+                    self._save_thread = None
+                    return
+            slot, payload = pending
 
-    def _save_to_disk(self):
-        """Writes the current preset_slots dictionary to a JSON file."""
-        try:
-            with open(self.preset_file, "w") as f:
-                json.dump(self.preset_slots, f, indent=4)
-        except Exception as e:
-            print(f"Error saving presets: {e}")
+            try:
+                # Write to a temp file and swap it in, so quitting mid-write can't truncate the presets
+                tmp_file = self.preset_file + ".tmp"
+                with open(tmp_file, "w") as f:
+                    f.write(payload)
+                os.replace(tmp_file, self.preset_file)
+                result_msg = f"PRESET {slot} SAVED TO DISK"
+            except Exception as e:
+                print(f"Error saving presets: {e}")
+                result_msg = f"PRESET {slot} SAVE FAILED"
+
+            with self._save_lock:
+                self._save_result_msg = result_msg
 
     def _load_from_disk(self):
         """Loads presets from disk or returns empty slots if file doesn't exist."""
@@ -202,54 +400,75 @@ class HUD:
         # Return empty slots if file is missing/invalid
         return {str(i): None for i in range(10)}
 
-    def draw_presets(self, surface, font):
-        # Position: Bottom Left
-        start_x, start_y = 15, surface.get_height() - 40
+    def _compose_presets(self, font) -> pygame.Surface:
+        """
+        Draws the ten preset slot boxes and their numbers onto a transparent strip.
+
+        Args:
+            font: The font for the slot numbers.
+
+        Returns:
+            The composed strip, to be blitted at the bottom left.
+        """
         size = 25
         spacing = 8
+        strip = pygame.Surface((10 * (size + spacing) - spacing, size), pygame.SRCALPHA)
 
+        # Slot numbers are collected and blitted in one go after the boxes (the boxes don't overlap)
+        blit_list = []
         for i in range(10):
             slot_key = str((i + 1) % 10)  # Order: 1, 2, ... 9, 0
             is_occupied = self.preset_slots[slot_key] is not None
 
-            rect = pygame.Rect(start_x + i * (size + spacing), start_y, size, size)
+            rect = pygame.Rect(i * (size + spacing), 0, size, size)
 
-            # Draw Box
+            # Draw Box (opaque, as the alpha was ignored when drawing straight onto the screen)
             if is_occupied:
                 # Filled box for saved presets (Sober Green/Cyan)
-                pygame.draw.rect(surface, (0, 200, 180, 180), rect)
+                pygame.draw.rect(strip, (0, 200, 180), rect)
             else:
                 # Outline for empty slots
-                pygame.draw.rect(surface, (100, 100, 100, 150), rect, 1)
+                pygame.draw.rect(strip, (100, 100, 100), rect, 1)
 
             # Draw Number
-            num_img = font.render(slot_key, True, (255, 255, 255))
+            num_img = self._render_text(font, slot_key, (255, 255, 255))
             # Center the number in the box
             text_rect = num_img.get_rect(center=rect.center)
-            surface.blit(num_img, text_rect)
+            blit_list.append((num_img, text_rect))
+
+        strip.blits(blit_list, doreturn=False)
+        return strip
+
+    def draw_presets(self, surface, font):
+        # Position: Bottom Left
+        start_x, start_y = 15, self._surface_size[1] - 40
+
+        if self._presets_surf is None:
+            self._presets_surf = self._compose_presets(font)
+        surface.blit(self._presets_surf, (start_x, start_y))
 
         # Draw temporary status message (e.g., "PRESET 1 SAVED")
-        if time.time() < self.msg_timer:
-            msg_img = font.render(self.msg, True, (255, 255, 0))
+        if self._now < self.msg_timer:
+            msg_img = self._render_text(font, self.msg, (255, 255, 0))
             surface.blit(msg_img, (start_x, start_y - 30))
 
     def draw_scene_controls(self, surface, font):
-        local_params = [p for p in self.params if p.category == "local"]
+        local_params = self._by_category["local"]
         if local_params:
             self._render_panel(surface, font, "--- SCENE CONTROLS ---", local_params, (10, 10), (0, 255, 150))
 
     def draw_physics_controls(self, surface, font, audio_state):
-        phys_params = [p for p in self.params if p.category == "physics"]
+        phys_params = self._by_category["physics"]
         if phys_params:
-            sw = surface.get_width()
+            sw = self._surface_size[0]
             self._render_panel_with_viz(
                 surface, font, "--- PHYSICS ---", phys_params, (sw - 410, 10), (255, 150, 0), audio_state, 400
             )
 
     def draw_audio_controls(self, surface, font, audio_state):
-        glob_params = [p for p in self.params if p.category == "global"]
+        glob_params = self._by_category["global"]
         if glob_params:
-            sw, sh = surface.get_width(), surface.get_height()
+            sw, sh = self._surface_size
             box_h = 45 + (len(glob_params) * 32)
             self._render_panel_with_viz(
                 surface,
@@ -263,18 +482,35 @@ class HUD:
             )
 
     def draw_fps(self, surface, font, fps):
-        # Draw it in the top right or bottom right
-        fps_text = f"FPS: {int(fps)}"
-        # Color logic: Red if it drops below 50 (indicating stutter)
-        fps_color = (0, 255, 0) if fps > 50 else (255, 50, 50)
-        fps_img = font.render(fps_text, True, fps_color)
+        # The number is unreadable at 60 updates per second anyway, so keep the last readout for a moment
+        now = self._now
+        if self._fps_img is None or now - self._fps_last_update >= self._fps_update_interval:
+            # Draw it in the top right or bottom right
+            fps_text = f"FPS: {int(fps)}"
+            # Color logic: Red if it drops below 50 (indicating stutter)
+            fps_color = (0, 255, 0) if fps > 50 else (255, 50, 50)
+            self._fps_img = self._render_text(font, fps_text, fps_color)
+            self._fps_last_update = now
 
         # Position: Bottom right, above presets
-        surface.blit(fps_img, (surface.get_width() - 100, surface.get_height() - 40))
+        sw, sh = self._surface_size
+        surface.blit(self._fps_img, (sw - 100, sh - 40))
 
     def draw(self, surface, font, audio_state, fps: float = 0):
+        # Engine parameter changes from this frame's key presses go out as one packet
+        EngineParameter.flush()
+
+        # Status of a finished background preset write (shown from here, pygame is only used on this thread)
+        if self._save_result_msg is not None:
+            with self._save_lock:
+                result_msg, self._save_result_msg = self._save_result_msg, None
+            if result_msg is not None:
+                self._show_message(result_msg)
+
         if not self.show_help:
             return  # Toggle 'H' to see menu
+        self._now = pygame.time.get_ticks()
+        self._surface_size = surface.get_size()
         self.draw_scene_controls(surface, font)
         self.draw_physics_controls(surface, font, audio_state)
         self.draw_audio_controls(surface, font, audio_state)
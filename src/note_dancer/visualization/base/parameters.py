@@ -1,79 +1,123 @@
 """Specific parameter that come with built-in visualizations."""
 
+from functools import lru_cache
+
+import numpy as np
 import pygame
 
 from note_dancer.visualization.base.hud import NumericParameter
 from note_dancer.visualization.base.parameters_base import EngineParameter, ParameterContainer
 
+# Meter colors of the three spectrum bands
+BAND_COLORS = {
+    "low": (255, 50, 50),
+    "mid": (50, 255, 50),
+    "high": (50, 100, 255),
+}
+
+
+@lru_cache(maxsize=16)
+def _sparkline_xs(n: int, x: int, w: int) -> np.ndarray:
+    """X pixel coordinates of n evenly spaced samples, only depends on the (fixed) graph geometry."""
+    xs = x + np.arange(n) * (w / n)
+    xs.flags.writeable = False
+    return xs
+
+
+def sparkline_points(values: np.ndarray, rect: pygame.Rect, full_scale: float) -> list:
+    """
+    Maps a history of values to polyline pixel coordinates inside `rect`, oldest value on the left.
+
+    Args:
+        values: The values to plot.
+        rect: The graph area on the target surface.
+        full_scale: The value that reaches the top edge, larger values are clamped to it.
+
+    Returns:
+        A list of (x, y) points, ready for `pygame.draw.lines`.
+    """
+    x, y, w, h = rect
+    xs = _sparkline_xs(len(values), x, w)
+    ys = y + h - np.minimum(h, (np.asarray(values) / full_scale * h).astype(np.intp))
+
+    # Interior points of flat runs don't change the drawn polyline, only the ends of each run are kept
+    keep = np.ones(len(ys), dtype=bool)
+    keep[1:-1] = (ys[1:-1] != ys[:-2]) | (ys[1:-1] != ys[2:])
+    return np.column_stack((xs[keep], ys[keep])).tolist()
+
 
 # Parameters with built-in visualizations
 class FluxImpactParameter(EngineParameter):
     """Visualizes the Spectral Flux (Transients) against a threshold."""
 
-    def draw_visual(self, surf: pygame.Surface, data: dict) -> None:
-        history = data.get("flux_history", [])
-        if not history:
+    __slots__ = ()
+
+    def draw_visual(self, surf: pygame.Surface, rect: pygame.Rect, data: dict) -> None:
+        history = data.get("flux_history")
+        if history is None or len(history) == 0:
             return
 
-        w, h = surf.get_size()
+        x, y, w, h = rect
         # Draw the Flux Sparkline
-        points = []
-        for i, val in enumerate(history):
-            x = (i / len(history)) * w
-            # Normalize flux: we'll assume 0-8 is a standard display range
-            y = h - min(h, int((val / 8.0) * h))
-            points.append((x, y))
-
-        if len(points) > 1:
-            pygame.draw.lines(surf, (200, 100, 255), False, points, 1)
+        # Normalize flux: we'll assume 0-8 is a standard display range
+        if len(history) > 1:
+            pygame.draw.lines(surf, (200, 100, 255), False, sparkline_points(history, rect, 8.0), 1)
 
         # Draw the Threshold Line (the 'Flux Thr' slider value)
-        line_y = h - min(h, int((self.value / 8.0) * h))
+        line_y = y + h - min(h, int((self.value / 8.0) * h))
         color = (255, 255, 255) if (history[-1] > self.value) else (150, 50, 200)
-        pygame.draw.line(surf, color, (0, line_y), (w, line_y), 2)
+        pygame.draw.line(surf, color, (x, line_y), (x + w, line_y), 2)
 
 
 class ChromaSensitivityParameter(NumericParameter):
     """Visualizes the 12 Chroma notes and the relative sensitivity gate."""
 
-    def draw_visual(self, surf: pygame.Surface, data: dict):
-        notes = data.get("prev_energies", [0.0] * 12)
-        w, h = surf.get_size()
+    __slots__ = ()
 
-        peak = max(notes) if any(notes) else 1.0
-        threshold_val = peak * self.value
+    def draw_visual(self, surf: pygame.Surface, rect: pygame.Rect, data: dict):
+        notes = np.asarray(data.get("prev_energies", [0.0] * 12))
+        x, y, w, h = rect
+
+        peak = float(notes.max()) or 1.0
         bar_w = w / 12
 
-        for i, energy in enumerate(notes):
-            bar_h = int((energy / peak) * h)
-            color = (0, 255, 150) if energy >= threshold_val else (40, 60, 50)
-            pygame.draw.rect(surf, color, (i * bar_w + 1, h - bar_h, bar_w - 2, bar_h))
+        # Heights and gate state for all 12 bars at once, the loop below only issues the draw calls
+        bar_hs = (notes / peak * h).astype(np.intp).tolist()
+        active = (notes >= peak * self.value).tolist()
+        draw_rect = pygame.draw.rect
+        for i, (bar_h, is_active) in enumerate(zip(bar_hs, active)):
+            color = (0, 255, 150) if is_active else (40, 60, 50)
+            draw_rect(surf, color, (x + i * bar_w + 1, y + h - bar_h, bar_w - 2, bar_h))
 
         # Relative threshold line
-        line_y = h - int(self.value * h)
-        pygame.draw.line(surf, (255, 255, 0), (0, line_y), (w, line_y), 1)
+        line_y = y + h - int(self.value * h)
+        pygame.draw.line(surf, (255, 255, 0), (x, line_y), (x + w, line_y), 1)
 
 
 class SpectrumGainParameter(EngineParameter):
     """Shows a live mini-meter next to the Gain sliders."""
 
-    def draw_visual(self, surf: pygame.Surface, data: dict) -> None:
-        w, h = surf.get_size()
-        # Determine which band this specific slider represents
-        band_key = "low" if "Low" in self.name else "mid" if "Mid" in self.name else "high"
-        val = data.get(band_key, 0.0)
+    __slots__ = ("band_key", "band_color")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Determine which band this specific slider represents (the name never changes)
+        self.band_key = "low" if "Low" in self.name else "mid" if "Mid" in self.name else "high"
+        self.band_color = BAND_COLORS[self.band_key]
 
-        # Color mapping
-        color = (255, 50, 50) if band_key == "low" else (50, 255, 50) if band_key == "mid" else (50, 100, 255)
+    def draw_visual(self, surf: pygame.Surface, rect: pygame.Rect, data: dict) -> None:
+        x, y, w, h = rect
+        val = data.get(self.band_key, 0.0)
+        color = self.band_color
 
         # Draw meter background
-        pygame.draw.rect(surf, (30, 30, 35), (0, 0, w, h))
+        surf.fill((30, 30, 35), rect)
         # Draw fill (clamped 0.0 to 1.0)
         fill_w = int(w * max(0, min(1.0, val)))
-        pygame.draw.rect(surf, color, (0, 0, fill_w, h))
+        surf.fill(color, (x, y, fill_w, h))
         # Draw a 'clipping' warning if the signal is hitting max
         if val >= 1.0:
-            pygame.draw.rect(surf, (255, 255, 255), (w - 5, 0, 5, h))
+            surf.fill((255, 255, 255), (x + w - 5, y, 5, h))
 
 
 # Containers of parameters for grouped displaying
@@ -83,6 +127,8 @@ class Envelope(ParameterContainer):
     It manages two internal NumericParameters and shares a unified visual.
     """
 
+    __slots__ = ("atk", "dcy", "band_key", "raw_key", "band_color")
+
     def __init__(self, name: str, atk: NumericParameter, dcy: NumericParameter, category: str = "physics"):
         # Pass the parameters up to the base class as a list
         super().__init__(name, [atk, dcy], category=category)
@@ -91,31 +137,35 @@ class Envelope(ParameterContainer):
         self.atk = atk
         self.dcy = dcy
 
-    def draw_visual(self, surf: pygame.Surface, data: dict):
+        # Audio state keys (e.g., 'low' and 'raw_low') and band color, derived from the name once
+        self.band_key = name.lower()
+        self.raw_key = f"raw_{self.band_key}"
+        self.band_color = BAND_COLORS.get(self.band_key, BAND_COLORS["high"])
+
+    def draw_visual(self, surf: pygame.Surface, rect: pygame.Rect, data: dict):
         """
         Renders the unified high-density 'Needle + Bar' graph.
         Shared by both Attack and Decay rows.
         """
-        w, h = surf.get_size()
+        x, y, w, h = rect
 
         # Fetch live audio data (e.g., 'low' and 'raw_low')
-        key = self.name.lower()
-        smooth_val = data.get(key, 0.0)
-        raw_val = data.get(f"raw_{key}", 0.0)
+        smooth_val = data.get(self.band_key, 0.0)
+        raw_val = data.get(self.raw_key, 0.0)
 
         # Draw Background
-        surf.fill((20, 20, 25))
+        surf.fill((20, 20, 25), rect)
 
         # 1. The 'Decay' Body (Band-specific colors)
-        color = (255, 50, 50) if key == "low" else (50, 255, 50) if key == "mid" else (50, 100, 255)
+        color = self.band_color
 
         fill_w = int(w * max(0.0, min(1.0, smooth_val)))
         if fill_w > 0:
-            pygame.draw.rect(surf, color, (0, 0, fill_w, h))
+            surf.fill(color, (x, y, fill_w, h))
 
         # 2. The 'Attack' Spark (White Needle for instant hits)
         hit_x = int(w * max(0.0, min(1.0, raw_val)))
-        pygame.draw.line(surf, (255, 255, 255), (hit_x, 0), (hit_x, h), 2)
+        pygame.draw.line(surf, (255, 255, 255), (x + hit_x, y), (x + hit_x, y + h), 2)
 
     def __str__(self) -> str:
         return f"Envelope: {self.name}"
@@ -9,6 +9,9 @@ import pygame
 class ParameterBase:
     """A minimal base so HUD can type-hint or identify parameters."""
 
+    # Parameters are plain value holders, slots keep them small and their attribute access direct
+    __slots__ = ("name", "category", "owner")
+
     def __init__(self, name: str, category: str):
         self.name = name
         self.category = category
@@ -16,9 +19,14 @@ class ParameterBase:
 
 
 class BooleanParameter(ParameterBase):
+    __slots__ = ("value", "_str_value", "_str_cache")
+
     def __init__(self, name: str, val: bool, category: str = "local") -> None:
         super().__init__(name, category)
         self.value = val
+        # Label of the last formatted value (value is also assigned directly, so compare instead of invalidating)
+        self._str_value: bool | None = None
+        self._str_cache = ""
 
     def toggle(self) -> bool:
         """Toggles the boolean state."""
@@ -26,14 +34,19 @@ class BooleanParameter(ParameterBase):
         return True
 
     def __str__(self) -> str:
-        v_str = "ON" if self.value else "OFF"
-        return f"{self.name}: {v_str}"
+        if self._str_value != self.value:
+            v_str = "ON" if self.value else "OFF"
+            self._str_cache = f"{self.name}: {v_str}"
+            self._str_value = self.value
+        return self._str_cache
 
     def __bool__(self) -> bool:
         return self.value
 
 
 class NumericParameter(ParameterBase):
+    __slots__ = ("value", "min_v", "max_v", "step", "fmt", "_str_value", "_str_cache")
+
     def __init__(
         self,
         name: str,
@@ -50,6 +63,9 @@ class NumericParameter(ParameterBase):
         self.max_v = max_v
         self.step = step
         self.fmt = fmt
+        # Label of the last formatted value (value is also assigned directly, so compare instead of invalidating)
+        self._str_value: float | None = None
+        self._str_cache = ""
 
     def adjust(self, direction: int) -> bool:
         """
@@ -61,8 +77,11 @@ class NumericParameter(ParameterBase):
         return self.value != old_val
 
     def __str__(self) -> str:
-        v_str = self.fmt.format(self.value)
-        return f"{self.name}: {v_str}"
+        if self._str_value != self.value:
+            v_str = self.fmt.format(self.value)
+            self._str_cache = f"{self.name}: {v_str}"
+            self._str_value = self.value
+        return self._str_cache
 
     def __float__(self) -> float:
         return self.value
@@ -71,10 +90,27 @@ class NumericParameter(ParameterBase):
 class EngineParameter(NumericParameter):
     """Extends NumericParameter to send updates back to the Audio Engine."""
 
+    __slots__ = ("engine_key",)
+
+    # Manual mapping from int to name (norm_mode)
+    NORM_MODE_NAMES = {0: "fixed", 1: "competitive", 2: "statistical"}
+
+    # Shared by all engine parameters: one socket, and the updates queued since the last flush()
+    cmd_sock: socket.socket | None = None
+    cmd_addr = ("127.0.0.1", 5006)
+    _pending: dict[str, float | str] = {}
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.cmd_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self.cmd_addr = ("127.0.0.1", 5006)
+        if EngineParameter.cmd_sock is None:
+            EngineParameter.cmd_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+        # Automatic mapping: "Low Gain" -> "low_gain" (the name never changes, so resolve it once)
+        engine_key = self.name.lower().replace(" ", "_")
+        # Manual override for specific naming differences
+        if engine_key == "flux_thr":
+            engine_key = "flux_sens"
+        self.engine_key = engine_key
 
     def adjust(self, direction: int) -> bool:
         changed = super().adjust(direction)
@@ -83,28 +119,30 @@ class EngineParameter(NumericParameter):
         return changed
 
     def send_to_engine(self):
-        """Sends current value to the audio engine via UDP."""
-        # Automatic mapping: "Low Gain" -> "low_gain"
-        engine_key = self.name.lower().replace(" ", "_")
-
-        # Manual override for specific naming differences
-        if engine_key == "flux_thr":
-            engine_key = "flux_sens"
-
-        # Manual mapping from int to name
+        """Queues the current value for the audio engine, it is sent with the next flush()."""
+        engine_key = self.engine_key
         if engine_key == "norm_mode":
-            mode_names = {0: "fixed", 1: "competitive", 2: "statistical"}
-            msg = json.dumps({engine_key: mode_names[int(self.value)]})
-            print(msg)
+            mode_name = self.NORM_MODE_NAMES[int(self.value)]
+            EngineParameter._pending[engine_key] = mode_name
+            print(json.dumps({engine_key: mode_name}))
         else:
-            msg = json.dumps({engine_key: float(self.value)})
+            EngineParameter._pending[engine_key] = float(self.value)
 
-        self.cmd_sock.sendto(msg.encode(), self.cmd_addr)
+    @classmethod
+    def flush(cls) -> None:
+        """Sends all queued updates to the audio engine as one JSON object (one UDP packet), if there are any."""
+        if not cls._pending:
+            return
+        msg = json.dumps(cls._pending)
+        cls._pending.clear()
+        cls.cmd_sock.sendto(msg.encode(), cls.cmd_addr)
 
 
 class ParameterContainer(ParameterBase):
     """Base class for grouping multiple parameters into a single UI row."""
 
+    __slots__ = ("_items",)
+
     def __init__(self, name: str, children: list[ParameterBase], category: str = "local"):
         super().__init__(name, category)
         self._items = children
@@ -129,6 +167,6 @@ class ParameterContainer(ParameterBase):
     def __str__(self) -> str:
         return f"Group: {self.name}"
 
-    def draw_visual(self, surf: pygame.Surface, data: dict):
-        """Optional: The visualization to display on the right side."""
+    def draw_visual(self, surf: pygame.Surface, rect: pygame.Rect, data: dict):
+        """Optional: The visualization to display on the right side, inside `rect` of `surf` (clip is set)."""
         pass
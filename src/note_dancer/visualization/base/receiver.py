@@ -1,9 +1,27 @@
 import errno
+import select
 import socket
 import struct
+from typing import NamedTuple
 
 from note_dancer.config import UDP_IP, UDP_PORT_ENGINE
 
+# Format: 7 control floats + 12 chroma floats (compiled once)
+PACKET_STRUCT = struct.Struct("!19f")
+
+
+class AudioPacket(NamedTuple):
+    """One decoded engine packet, fields in wire order (7 control floats + 12 chroma floats)."""
+
+    brightness: float = 0.0
+    flux: float = 0.0
+    low: float = 0.0
+    mid: float = 0.0
+    high: float = 0.0
+    bpm: float = 120.0
+    is_beat: bool = False
+    notes: tuple[float, ...] = (0.0,) * 12
+
 
 class AudioReceiver:
     def __init__(self, ip: str = UDP_IP, port: int = UDP_PORT_ENGINE):
@@ -18,20 +36,25 @@ class AudioReceiver:
         self.sock.setblocking(False)
 
         # Format: 7 control floats + 12 chroma floats
-        self.packet_format = "!19f"
-        self.packet_size = struct.calcsize(self.packet_format)
+        self.packet_format = PACKET_STRUCT.format
+        self.packet_size = PACKET_STRUCT.size
+
+        # Datagrams are received into this preallocated buffer instead of a new bytes object per packet,
+        # valid ones are swapped into the second buffer so only the newest one needs to be unpacked
+        self._recv_buf = bytearray(self.packet_size)
+        self._newest_buf = bytearray(self.packet_size)
+
+        # Upper bound of datagrams read per call, keeps a sender burst from stalling a frame
+        self.max_drain = 32
+
+        # Readiness poller (not available on Windows), lets the drain loop stop without an EAGAIN exception
+        self._poller = None
+        if hasattr(select, "poll"):
+            self._poller = select.poll()
+            self._poller.register(self.sock, select.POLLIN)
 
         # Internal state to hold the latest data
-        self.latest_data = {  # Initialize with dummy values
-            "brightness": 0.0,
-            "flux": 0.0,
-            "low": 0.0,
-            "mid": 0.0,
-            "high": 0.0,
-            "bpm": 120.0,
-            "is_beat": 0.0,
-            "notes": [0.0] * 12,
-        }
+        self.latest_data = AudioPacket()  # Initialize with dummy values
         self._is_bound = False
 
     def bind(self):
@@ -43,71 +66,89 @@ class AudioReceiver:
         except Exception as e:
             print(f"Error binding socket: {e}")
 
-    def get_latest(self) -> tuple[dict, int]:
+    def get_latest(self) -> tuple[AudioPacket, int]:
         """
         Non-blocking fetch. Clears the UDP buffer to get the MOST RECENT packet.
-        Returns tuple of (data dictionary, number of packets drained from buffer).
+        Returns tuple of (latest packet, number of packets drained from buffer).
         """
         if not self._is_bound:
             self.bind()
 
-        # We loop until the buffer is empty. This prevents 'visual lag'
+        # We loop until the buffer is empty (or max_drain is hit). This prevents 'visual lag'
         # caused by packets queuing up in the OS network stack.
         packets_drained = 0
-        while True:
+        poll = self._poller.poll if self._poller is not None else None
+        for _ in range(self.max_drain):
+            # An empty queue is detected with a zero-timeout poll, raising/catching EAGAIN is slower
+            if poll is not None and not poll(0):
+                break
             try:
-                data, _ = self.sock.recvfrom(self.packet_size)
-
-                # Validate packet size before attempting to unpack
-                if len(data) != self.packet_size:
-                    continue  # Skip malformed packet, try next one
-
-                try:
-                    unpacked = struct.unpack(self.packet_format, data)
-                    self.latest_data = {
-                        "brightness": unpacked[0],
-                        "flux": unpacked[1],
-                        "low": unpacked[2],
-                        "mid": unpacked[3],
-                        "high": unpacked[4],
-                        "bpm": unpacked[5],
-                        "is_beat": unpacked[6] > 0.5,  # Convert float to bool
-                        "notes": list(unpacked[7:]),
-                    }
-                    packets_drained += 1
-                except struct.error as e:
-                    # Unpack failed, skip this packet and try next one
-                    print(f"Malformed packet (unpack error): {e}")
-                    continue
-
+                n_bytes = self.sock.recv_into(self._recv_buf)
             except socket.error as e:
                 # EAGAIN or EWOULDBLOCK means the buffer is finally empty
                 err = e.args[0]
-                if err == errno.EAGAIN or err == errno.EWOULDBLOCK:
-                    break
-                else:
+                if err != errno.EAGAIN and err != errno.EWOULDBLOCK:
                     # A real error occurred
                     print(f"Socket error: {e}")
-                    break
+                break
+
+            # Validate packet size, skip malformed packets
+            if n_bytes == self.packet_size:
+                # Keep it as the newest valid packet, stale ones are never unpacked
+                self._recv_buf, self._newest_buf = self._newest_buf, self._recv_buf
+                packets_drained += 1
+
+        if packets_drained:
+            unpacked = PACKET_STRUCT.unpack_from(self._newest_buf)
+            self.latest_data = AudioPacket(
+                *unpacked[:6],
+                unpacked[6] > 0.5,  # Convert float to bool
+                unpacked[7:],
+            )
 
         return self.latest_data, packets_drained
 
+    def wait_for_packet(self, timeout: float | None = None) -> AudioPacket | None:
+        """
+        Blocking fetch. Waits until at least one packet arrives, then drains the buffer
+        so that packets which queued up in the meantime are dropped instead of adding latency.
+        Returns the most recent packet, or None if the timeout expired.
+        """
+        if not self._is_bound:
+            self.bind()
+
+        readable, _, _ = select.select([self.sock], [], [], timeout)
+        if not readable:
+            return None
+
+        data, packets_drained = self.get_latest()
+        return data if packets_drained else None
+
     def close(self):
         """Closes the socket."""
         self.sock.close()
 
+    def __enter__(self) -> "AudioReceiver":
+        """Binds the socket (if not done yet), the socket is closed again when the block exits."""
+        if not self._is_bound:
+            self.bind()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
 
 # --- Example Usage ---
 if __name__ == "__main__":
-    receiver = AudioReceiver()
-    try:
-        while True:
-            data, _ = receiver.get_latest()
-            if data:
-                # Example: Accessing specific values
-                if data["is_beat"]:
-                    print(f">> BEAT! BPM: {data['bpm']:.1f}")
-                else:
-                    print(f"Flux: {data['flux']:.2f}", end="\r")
-    except KeyboardInterrupt:
-        receiver.close()
+    with AudioReceiver() as receiver:
+        try:
+            while True:
+                data, _ = receiver.get_latest()
+                if data:
+                    # Example: Accessing specific values
+                    if data.is_beat:
+                        print(f">> BEAT! BPM: {data.bpm:.1f}")
+                    else:
+                        print(f"Flux: {data.flux:.2f}", end="\r")
+        except KeyboardInterrupt:
+            pass
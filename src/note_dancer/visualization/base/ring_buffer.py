@@ -0,0 +1,50 @@
+"""Fixed-size NumPy ring buffer for per-frame histories (sparklines, timing statistics)."""
+
+import numpy as np
+import numpy.typing as npt
+
+
+class RingBuffer:
+    __slots__ = ("buf", "head", "count")
+
+    def __init__(self, size: int, dtype: npt.DTypeLike = np.float32, prefilled: bool = False) -> None:
+        """
+        Initializes the RingBuffer, a `deque(maxlen=size)` replacement whose contents can be
+        read back as one contiguous array for vectorized consumers.
+
+        Args:
+            size: Maximum number of stored values, the oldest ones get overwritten.
+            dtype: NumPy dtype of the stored values.
+            prefilled: Start out full of zeros (like `deque([0] * size, maxlen=size)`) instead of empty.
+        """
+        self.buf = np.zeros(size, dtype=dtype)
+        self.head = 0  # Next write position, which is also the oldest value once the buffer is full
+        self.count = size if prefilled else 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def push(self, value: float) -> None:
+        """
+        Appends a value, overwriting the oldest one if the buffer is full.
+
+        Args:
+            value: The value to store.
+        """
+        self.buf[self.head] = value
+        self.head = (self.head + 1) % len(self.buf)
+        if self.count < len(self.buf):
+            self.count += 1
+
+    def view(self) -> np.ndarray:
+        """
+        Returns the stored values in chronological order (oldest first).
+
+        Returns:
+            A view of the buffer while it has not wrapped around yet, otherwise a rolled copy.
+        """
+        if self.count < len(self.buf):
+            return self.buf[: self.count]
+        if self.head == 0:
+            return self.buf
+        return np.concatenate((self.buf[self.head :], self.buf[: self.head]))
@@ -19,6 +19,9 @@ class DashboardVisualizer(AudioVisualizationBase):
         self.large_font = pygame.font.SysFont("Arial", 32, bold=True)
         self.note_names = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
 
+        # Note label glyphs, rendered once on the first frame (the font is only known at draw time)
+        self._note_label_surfs: list[pygame.Surface] | None = None
+
         # Internal accumulator for a smoother "Beat Pulse" effect
         self.pulse_val = 0.0
 
@@ -53,7 +56,7 @@ class DashboardVisualizer(AudioVisualizationBase):
         pulse_radius = 50 + int(self.pulse_val * 40)
 
         # Border thickness still driven by flux for "impact"
-        flux_border = max(1, int(self.data["flux"] * 3))
+        flux_border = max(1, int(self.data.flux * 3))
         pygame.draw.circle(screen, (255, 255, 255), (WIDTH // 2, 150), pulse_radius, flux_border)
 
         # Use the Hedged and Smoothed BPM from events
@@ -70,21 +73,25 @@ class DashboardVisualizer(AudioVisualizationBase):
         # --- C. Brightness Meter ---
         bright_x = 450
         # Brightness isn't smoothed in the base class yet, so we use self.data
-        self.draw_bar(screen, bright_x, y_pos, 30, bar_h, self.data["brightness"], (255, 255, 255), "BRIGHT", font)
+        self.draw_bar(screen, bright_x, y_pos, 30, bar_h, self.data.brightness, (255, 255, 255), "BRIGHT", font)
 
         # --- D. Chroma Notes ---
         chroma_start_x = 100
         chroma_y = 550
-        for i, val in enumerate(self.data["notes"]):
+        if self._note_label_surfs is None:
+            self._note_label_surfs = [font.render(name, True, TEXT_COLOR) for name in self.note_names]
+        label_surfs = self._note_label_surfs
+        active_notes = set(events["active_notes"])
+
+        for i, val in enumerate(self.data.notes):
             n_x = chroma_start_x + (i * 50)
             n_h = int(val * 40)
 
             # Highlight notes that pass the gated Note Sens threshold
-            is_active = i in events["active_notes"]
-            color = NOTE_COLOR if is_active else (60, 60, 40)
+            color = NOTE_COLOR if i in active_notes else (60, 60, 40)
 
             pygame.draw.rect(screen, color, (n_x, chroma_y - n_h, 30, n_h))
-            screen.blit(font.render(self.note_names[i], True, TEXT_COLOR), (n_x, chroma_y + 5))
+            screen.blit(label_surfs[i], (n_x, chroma_y + 5))
 
 
 def run():
@@ -1,201 +1,410 @@
 import colorsys
 import math
 from collections import OrderedDict
+from functools import lru_cache
 
+import numpy as np
 import pygame
 
+# Sin/cos lookup tables in 0.1° steps, pre-rotated by -90° so that radar angle 0 points up (12 o'clock)
+LUT_STEPS_PER_DEGREE = 10
+LUT_SIZE = 360 * LUT_STEPS_PER_DEGREE
+SIN_LUT = tuple(math.sin(math.radians(i / LUT_STEPS_PER_DEGREE - 90)) for i in range(LUT_SIZE))
+COS_LUT = tuple(math.cos(math.radians(i / LUT_STEPS_PER_DEGREE - 90)) for i in range(LUT_SIZE))
+_SIN_LUT_ARRAY = np.array(SIN_LUT)
+_COS_LUT_ARRAY = np.array(COS_LUT)
+# Angular spacing of the trailing arc dots (0.05 rad) in lookup table steps
+_TRAIL_LUT_STEPS = round(math.degrees(0.05) * LUT_STEPS_PER_DEGREE)
 
-class NoteTrace:
+# Classic rainbow color per note, there are only 12 hues so they are converted once at import
+RAINBOW_COLORS = tuple(
+    tuple(int(c * 255) for c in colorsys.hsv_to_rgb(note_index / 12.0, 0.8, 1.0)) for note_index in range(12)
+)
+
+
+def _thermal_color(note_index: int) -> tuple[int, int, int]:
+    """Thermal gradient (Red -> Orange -> White) over the 12 notes."""
+    t = note_index / 11.0  # Normalize 0.0 to 1.0
+    if t < 0.5:  # Red to Orange
+        lerp = t * 2.0
+        return (255, int(160 * lerp), 0)
+    # Orange to White
+    lerp = (t - 0.5) * 2.0
+    return (255, 160 + int(95 * lerp), int(255 * lerp))
+
+
+THERMAL_COLORS = tuple(_thermal_color(note_index) for note_index in range(12))
+
+# Neon 'heat' per note: a non-linear mix (power curve) so the 'pure' color
+# stays dominant longer, and only the highest notes 'ignite'
+NEON_HEAT = tuple((note_index / 12.0) ** 1.5 for note_index in range(12))
+
+
+def _schema_color(note_index: int, schema_idx: int, neon_base_color: tuple[int, int, int]) -> tuple[int, int, int]:
+    """Calculates the RGB color based on the selected schema."""
+
+    # SCHEMA 0: Rainbow (Classic)
+    if schema_idx == 0:
+        return RAINBOW_COLORS[note_index]
+
+    # SCHEMA 1: Thermal (Red -> Orange -> White)
+    elif schema_idx == 1:
+        return THERMAL_COLORS[note_index]
+
+    # SCHEMA 2: Monochrome Neon
+    elif schema_idx == 2:
+        # Instead of white, we mix toward a 'glow' color (like the Glacier Blue)
+        glow_color = (220, 240, 255)
+        heat = NEON_HEAT[note_index]
+
+        r = int(neon_base_color[0] + (glow_color[0] - neon_base_color[0]) * heat)
+        g = int(neon_base_color[1] + (glow_color[1] - neon_base_color[1]) * heat)
+        b = int(neon_base_color[2] + (glow_color[2] - neon_base_color[2]) * heat)
+
+        return (r, g, b)
+
+    return (255, 255, 255)
+
+
+@lru_cache(maxsize=16)
+def schema_palette(schema_idx: int, neon_base_color: tuple[int, int, int]) -> tuple[tuple[int, int, int], ...]:
+    """
+    The colors of all 12 notes for a color schema.
+
+    Args:
+        schema_idx: The selected color schema (0: Rainbow, 1: Thermal, 2: Monochrome Neon).
+        neon_base_color: The base color of the neon schema, ignored by the others.
+
+    Returns:
+        A tuple of 12 RGB tuples, indexed by note.
+    """
+    return tuple(_schema_color(note_index, schema_idx, neon_base_color) for note_index in range(12))
+
+
+class NoteTraces:
     # Class-level LRU cache, shared by all instances
     # OrderedDict maintains insertion order for LRU eviction
     _glowing_orb_cache = OrderedDict()
     _CACHE_MAX_SIZE = 2000  # Keep only 2000 most recent items
 
-    def __init__(self, note_index, angle, energy, decay_rate, inner_r, spacing, max_size):
-        self.note_index = note_index
-        self.angle = angle
-        self.energy = energy
-        self.life = 255.0
-        self.decay_rate = decay_rate
-        self.inner_r = inner_r
-        self.spacing = spacing
-        self.max_size = max_size
-
-        rgb = colorsys.hsv_to_rgb(note_index / 12.0, 0.8, 1.0)
-        self.color = (int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255))
-
-    def update(self):
-        self.life -= self.decay_rate
-        return self.life > 0
-
-    def _get_current_color(self, schema_idx, neon_base_color):
-        """Calculates the RGB color based on the selected schema."""
-
-        # SCHEMA 0: Rainbow (Classic)
-        if schema_idx == 0:
-            rgb = colorsys.hsv_to_rgb(self.note_index / 12.0, 0.8, 1.0)
-            return (int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255))
-
-        # SCHEMA 1: Thermal (Red -> Orange -> White)
-        elif schema_idx == 1:
-            t = self.note_index / 11.0  # Normalize 0.0 to 1.0
-            if t < 0.5:  # Red to Orange
-                lerp = t * 2.0
-                return (255, int(160 * lerp), 0)
-            else:  # Orange to White
-                lerp = (t - 0.5) * 2.0
-                return (255, 160 + int(95 * lerp), int(255 * lerp))
-
-        # SCHEMA 2: Monochrome Neon
-        elif schema_idx == 2:
-            # mix represents the 'heat' of the note (0.0 to 1.0)
-            mix = self.note_index / 12.0
-
-            # Instead of white, we mix toward a 'glow' color (like the Glacier Blue)
-            glow_color = (220, 240, 255)
-
-            # We use a non-linear mix (power curve) so the 'pure' color
-            # stays dominant longer, and only the highest notes 'ignite'.
-            heat = mix**1.5
-
-            r = int(neon_base_color[0] + (glow_color[0] - neon_base_color[0]) * heat)
-            g = int(neon_base_color[1] + (glow_color[1] - neon_base_color[1]) * heat)
-            b = int(neon_base_color[2] + (glow_color[2] - neon_base_color[2]) * heat)
-
-            return (r, g, b)
-
-        return (255, 255, 255)
-
-    def draw(self, surface, center, low_boost, lag_comp, style_idx, schema_idx, neon_color):
+    # White orb sprites per quantized size, the colored cache entries are tinted copies of these
+    _orb_stencils = {}
+
+    # Same idea for the sober node sprites, which also depend on the bass 'squash'
+    _sober_node_cache = OrderedDict()
+    _SOBER_CACHE_MAX_SIZE = 512
+
+    # Rotated, alpha-filled segment sprites of the segmented arc style, per whole degree of angle
+    _segment_cache = OrderedDict()
+    _SEGMENT_CACHE_MAX_SIZE = 1024
+
+    # One NumPy array per trace attribute (structure of arrays)
+    _COLUMNS = ("note_index", "angle", "energy", "life", "decay_rate", "inner_r", "spacing", "max_size")
+
+    def __init__(self, capacity: int = 256) -> None:
+        """
+        Holds all live note traces of the radar as a structure of arrays.
+
+        Every trace attribute lives in its own NumPy column, so aging and culling run as a few
+        vectorized operations per frame instead of one Python method call per trace.
+
+        Args:
+            capacity: Initial number of trace slots, the columns double in size when it is exceeded.
+        """
+        self.count = 0
+        self.note_index = np.zeros(capacity, dtype=np.intp)
+        self.angle = np.zeros(capacity)
+        self.energy = np.zeros(capacity)
+        self.life = np.zeros(capacity)
+        self.decay_rate = np.zeros(capacity)
+        self.inner_r = np.zeros(capacity)
+        self.spacing = np.zeros(capacity)
+        self.max_size = np.zeros(capacity)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def spawn(
+        self,
+        note_index: int,
+        angle: float,
+        energy: float,
+        decay_rate: float,
+        inner_r: float,
+        spacing: float,
+        max_size: float,
+    ) -> None:
+        """
+        Appends a new, fully alive trace.
+
+        Args:
+            note_index: Chroma note (0-11), selects the ring and the color.
+            angle: Radar angle in degrees at which the note was detected.
+            energy: Normalized note energy (0.0-1.0), drives the node size.
+            decay_rate: Life lost per frame (life starts at 255).
+            inner_r: Radius of the innermost ring.
+            spacing: Distance between two rings.
+            max_size: Node size at full energy.
+        """
+        if self.count == len(self.life):
+            self._grow()
+
+        i = self.count
+        self.note_index[i] = note_index
+        self.angle[i] = angle
+        self.energy[i] = energy
+        self.life[i] = 255.0
+        self.decay_rate[i] = decay_rate
+        self.inner_r[i] = inner_r
+        self.spacing[i] = spacing
+        self.max_size[i] = max_size
+        self.count += 1
+
+    def _grow(self) -> None:
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            setattr(self, name, np.concatenate((column, np.zeros_like(column))))
+
+    def update(self) -> None:
+        """
+        Ages all traces by their decay rate and removes the dead ones.
+
+        Removal is an in-place swap-pop: dead slots below the new count are refilled with the
+        survivors from the tail, so only as many entries move as traces died (draw order is not kept).
+        """
+        n = self.count
+        life = self.life[:n]
+        life -= self.decay_rate[:n]
+
+        alive = life > 0
+        if alive.all():
+            return
+
+        new_count = int(np.count_nonzero(alive))
+        holes = np.flatnonzero(~alive[:new_count])
+        survivors = np.flatnonzero(alive[new_count:]) + new_count
+        if len(holes):
+            for name in self._COLUMNS:
+                column = getattr(self, name)
+                column[holes] = column[survivors]
+        self.count = new_count
+
+    def draw(self, surface, center, low_boost, lag_comp, style_idx, schema_idx, neon_color, blit_batch=None):
+        """
+        Draws all traces in the selected style.
+
+        If `blit_batch` is given, styles that boil down to a single cached sprite append their
+        (surface, dest) pair to it instead of blitting, so the caller can submit all of them at once.
+        """
+        n = self.count
         duck_factor = low_boost * 30.0
-        visual_angle = self.angle + lag_comp
-        r_pos = self.inner_r + (self.note_index * self.spacing) - duck_factor
-
-        rad = math.radians(visual_angle - 90)
-        x = center[0] + r_pos * math.cos(rad)
-        y = center[1] + r_pos * math.sin(rad)
-
-        alpha = max(0, min(255, int(self.life)))
-        # size = int(2 + (self.energy * self.max_size))
-        size = int(
-            2 + (self.energy * self.energy * self.max_size)
-        )  # energy squared to ensure that small sizes are clearly distinct from large one
-        # size = int(
-        #    2 + (pow(self.energy, 2) * self.max_size)
-        # )  # logarithmic scaleing from (frame-wide normalized) energy to size
-
-        self.color = self._get_current_color(schema_idx, neon_color)
-
-        match int(style_idx):
-            case 0:
-                self._draw_glowing_orb(surface, x, y, size, alpha)
+        # Bass boost in 1/16 steps for the sprite-cached styles (continuous values would never hit the cache)
+        q_boost = int(low_boost * 16)
+        style = int(style_idx)
+
+        # Vectorized geometry for all traces at once, the loop below only indexes the results
+        note_index = self.note_index[:n]
+        energy = self.energy[:n]
+        visual_angle = self.angle[:n] + lag_comp
+        r_pos = self.inner_r[:n] + (note_index * self.spacing[:n]) - duck_factor
+
+        lut_idx = (visual_angle * LUT_STEPS_PER_DEGREE).astype(np.intp) % LUT_SIZE
+        xs = center[0] + r_pos * _COS_LUT_ARRAY[lut_idx]
+        ys = center[1] + r_pos * _SIN_LUT_ARRAY[lut_idx]
+
+        # Alphas are clamped to 0-255 here once, the style helpers can use them as-is
+        alphas = np.clip(self.life[:n], 0, 255).astype(np.uint8)
+        # energy squared to ensure that small sizes are clearly distinct from large one
+        sizes = (2 + (energy * energy * self.max_size[:n])).astype(np.intp)
+
+        if style != 1:
+            # The sprite styles quantize alpha down (orbs and segments to multiples of 8, sober nodes to 16),
+            # fainter traces would only blit a fully transparent sprite, so they are dropped up front
+            visible = alphas >= (16 if style == 3 else 8)
+            if not visible.all():
+                note_index, xs, ys = note_index[visible], xs[visible], ys[visible]
+                sizes, alphas, lut_idx = sizes[visible], alphas[visible], lut_idx[visible]
+                max_sizes = self.max_size[:n][visible]
+            else:
+                max_sizes = self.max_size[:n]
+
+        # The schema only depends on the note, so all 12 colors are resolved up front (and cached across frames)
+        palette = schema_palette(schema_idx, neon_color)
+        colors = [palette[i] for i in note_index.tolist()]
+
+        # The style is the same for every trace, so it is dispatched once and each loop only walks the columns it needs
+        match style:
             case 1:
-                self._draw_trailing_arc(surface, size, center, rad, r_pos, alpha)
+                draw_arc = self._draw_trailing_arc
+                for color, size, angle_idx, r, alpha in zip(
+                    colors, sizes.tolist(), lut_idx.tolist(), r_pos.tolist(), alphas.tolist()
+                ):
+                    draw_arc(surface, color, size, center, angle_idx, r, alpha)
             case 2:
-                self._draw_segmented_arc(surface, x, y, self.max_size, visual_angle, alpha)
+                draw_segment = self._draw_segmented_arc
+                for color, x, y, max_size, angle_idx, alpha in zip(
+                    colors, xs.tolist(), ys.tolist(), max_sizes.tolist(), lut_idx.tolist(), alphas.tolist()
+                ):
+                    draw_segment(surface, color, x, y, max_size, angle_idx, alpha, blit_batch)
             case 3:
-                self._draw_sober_node(surface, x, y, size, alpha, low_boost)
+                draw_node = self._draw_sober_node
+                for color, x, y, size, alpha in zip(colors, xs.tolist(), ys.tolist(), sizes.tolist(), alphas.tolist()):
+                    draw_node(surface, color, x, y, size, alpha, q_boost, blit_batch)
             case _:
-                self._draw_glowing_orb(surface, x, y, size, alpha)
+                draw_orb = self._draw_glowing_orb
+                for color, x, y, size, alpha in zip(colors, xs.tolist(), ys.tolist(), sizes.tolist(), alphas.tolist()):
+                    draw_orb(surface, color, x, y, size, alpha, blit_batch)
 
-    def _draw_glowing_orb(self, surface, x, y, size, alpha):
+    def _draw_glowing_orb(self, surface, color, x, y, size, alpha, blit_batch=None):
         # 2. BRUTAL QUANTIZATION
         # Floating point numbers are the enemy of caches.
         # We round to the nearest 'step' to ensure we hit existing images.
 
         if size > 100:
-            q_size = (int(size) // 10) * 10  # Very aggressive for big notes
+            q_size = size // 10 * 10  # Very aggressive for big notes
         else:
-            q_size = (int(size) // 4) * 4
+            q_size = size & ~3
 
         # q_size = max(1, int(size))  # Integer pixel size
-        q_alpha = max(0, (int(alpha) // 8) * 8)  # Groups of 8 (only ~32 possible alpha states)
+        q_alpha = alpha & ~7  # Groups of 8 (only ~32 possible alpha states)
         # q_alpha = max(0, (int(alpha) // 20) * 20)  # lower this number for smoother note deissapearing (with alpha)
 
         # Quantize color to 16-step increments (reduces 16 million colors to a few hundred)
-        q_color = ((self.color[0] // 16) * 16, (self.color[1] // 16) * 16, (self.color[2] // 16) * 16)
-        # q_color = tuple((c // 50) * 50 for c in self.color)  # lower this for more different colors
+        q_color = (color[0] & 0xF0, color[1] & 0xF0, color[2] & 0xF0)
+        # q_color = tuple((c // 50) * 50 for c in color)  # lower this for more different colors
 
         # 3. CACHE LOOKUP
         cache_key = (q_color, q_size, q_alpha)
 
-        if cache_key not in self._glowing_orb_cache:
-            # 4. RENDER ONCE (The expensive part)
-            surf_dim = q_size * 4
-            note_surf = pygame.Surface((surf_dim, surf_dim), pygame.SRCALPHA)
+        cache = self._glowing_orb_cache
+        cached_img = cache.get(cache_key)
 
-            # Draw the circles using the quantized color and alpha
-            pygame.draw.circle(note_surf, (*q_color, q_alpha // 8), (surf_dim // 2, surf_dim // 2), q_size * 2)
-            pygame.draw.circle(note_surf, (*q_color, q_alpha), (surf_dim // 2, surf_dim // 2), q_size // 2)
+        if cached_img is None:
+            # 4. RENDER ONCE (The expensive part)
+            # Tint a copy of the white stencil for this size instead of rasterizing the circles again
+            note_surf = self._get_orb_stencil(q_size).copy()
+            note_surf.fill((*q_color, q_alpha), special_flags=pygame.BLEND_RGBA_MULT)
 
             # 5. OPTIMIZE FOR GPU/CPU BLIT
             # .convert_alpha() is what actually fixes the 4K/High-Res lag
-            self._glowing_orb_cache[cache_key] = note_surf.convert_alpha()
+            cached_img = cache[cache_key] = note_surf.convert_alpha()
 
             # Simple LRU: evict oldest item if over limit
-            while len(self._glowing_orb_cache) > self._CACHE_MAX_SIZE:
-                self._glowing_orb_cache.popitem(last=False)  # Remove oldest (FIFO)
+            while len(cache) > self._CACHE_MAX_SIZE:
+                cache.popitem(last=False)  # Remove least recently used
         else:
             # Move to end (mark as recently used)
-            self._glowing_orb_cache.move_to_end(cache_key)
+            cache.move_to_end(cache_key)
 
-        # 6. BLIT (The fast part)
-        cached_img = self._glowing_orb_cache[cache_key]
-        surface.blit(cached_img, (x - cached_img.get_width() // 2, y - cached_img.get_height() // 2))
+        # 6. BLIT (The fast part), or defer it to the caller's batch
+        dest = (x - cached_img.get_width() // 2, y - cached_img.get_height() // 2)
+        if blit_batch is None:
+            surface.blit(cached_img, dest)
+        else:
+            blit_batch.append((cached_img, dest))
 
-    def _draw_radial_beam(self, surface, x, y, size, center, rad, r_pos, alpha):
+    @classmethod
+    def _get_orb_stencil(cls, q_size):
+        """White glowing orb of the given quantized size, rasterized once and tinted per color/alpha."""
+        stencil = cls._orb_stencils.get(q_size)
+        if stencil is None:
+            surf_dim = q_size * 4
+            stencil = pygame.Surface((surf_dim, surf_dim), pygame.SRCALPHA)
+            # Halo at 1/8 and core at full alpha, scaled down to the target alpha by the tint
+            pygame.draw.circle(stencil, (255, 255, 255, 32), (surf_dim // 2, surf_dim // 2), q_size * 2)
+            pygame.draw.circle(stencil, (255, 255, 255, 255), (surf_dim // 2, surf_dim // 2), q_size // 2)
+            stencil = cls._orb_stencils[q_size] = stencil.convert_alpha()
+        return stencil
+
+    def _draw_radial_beam(self, surface, color, x, y, size, center, rad, r_pos, alpha):
         # Draw a line from the note position pointing inward
         inner_x = center[0] + (r_pos - size * 2) * math.cos(rad)
         inner_y = center[1] + (r_pos - size * 2) * math.sin(rad)
-        pygame.draw.line(surface, (*self.color, alpha), (x, y), (inner_x, inner_y), 3)
-
-    def _draw_segmented_arc(self, surface, x, y, max_size, visual_angle, alpha):
-        # Draws a small rectangle rotated to the tangent of the circle
-        rect_w, rect_h = max_size * 2, max_size // 2
-        rect_surf = pygame.Surface((rect_w, rect_h), pygame.SRCALPHA)
-        rect_surf.fill((*self.color, alpha))
-        # Rotate surface to match the radar angle
-        rotated_surf = pygame.transform.rotate(rect_surf, -visual_angle)
-        surface.blit(rotated_surf, rotated_surf.get_rect(center=(x, y)))
-
-    def _draw_trailing_arc(self, surface, size, center, rad, r_pos, alpha):
+        pygame.draw.line(surface, (*color, alpha), (x, y), (inner_x, inner_y), 3)
+
+    def _draw_segmented_arc(self, surface, color, x, y, max_size, angle_idx, alpha, blit_batch=None):
+        # Draws a small alpha-blended rectangle rotated to the tangent of the circle. The rotated sprite is
+        # cached per whole degree and quantized alpha, so steady frames only blit (or defer to the batch).
+        q_alpha = alpha & ~7
+        cache_key = (color, int(max_size), q_alpha, angle_idx // LUT_STEPS_PER_DEGREE)
+        cache = self._segment_cache
+        segment_img = cache.get(cache_key)
+
+        if segment_img is None:
+            rect_w, rect_h = max_size * 2, max_size // 2
+            rect_surf = pygame.Surface((rect_w, rect_h), pygame.SRCALPHA)
+            rect_surf.fill((*color, q_alpha))
+            # Rotate surface to match the radar angle
+            segment_img = pygame.transform.rotate(rect_surf, -(angle_idx // LUT_STEPS_PER_DEGREE))
+            segment_img = cache[cache_key] = segment_img.convert_alpha()
+            while len(cache) > self._SEGMENT_CACHE_MAX_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(cache_key)
+
+        dest = (x - segment_img.get_width() // 2, y - segment_img.get_height() // 2)
+        if blit_batch is None:
+            surface.blit(segment_img, dest)
+        else:
+            blit_batch.append((segment_img, dest))
+
+    def _draw_trailing_arc(self, surface, color, size, center, angle_idx, r_pos, alpha):
         # Draw 3-4 smaller dots trailing behind the current angle
         for i in range(1, 4):
-            trail_rad = rad - (i * 0.05)  # Shift angle back
-            tx = center[0] + r_pos * math.cos(trail_rad)
-            ty = center[1] + r_pos * math.sin(trail_rad)
-            pygame.draw.circle(surface, (*self.color, alpha // (i * 2)), (int(tx), int(ty)), size // (i + 1))
+            trail_idx = (angle_idx - i * _TRAIL_LUT_STEPS) % LUT_SIZE  # Shift angle back
+            tx = center[0] + r_pos * COS_LUT[trail_idx]
+            ty = center[1] + r_pos * SIN_LUT[trail_idx]
+            pygame.draw.circle(surface, (*color, alpha // (i * 2)), (int(tx), int(ty)), size // (i + 1))
 
-    def _draw_sober_node(self, surface, x, y, size, alpha, low_boost):
+    def _draw_sober_node(self, surface, color, x, y, size, alpha, q_boost, blit_batch=None):
         """
         Style 1 (Hot/Sober Orb): High-fidelity node with sidechain 'Squash'
-        and color-shifting brightness logic.
+        and color-shifting brightness logic. `q_boost` is the bass boost in 1/16 steps.
         """
         # 1. Sidechain Scaling (The "Squash")
         # Higher bass (low_boost) makes the node smaller/compressed
-        swell_size = int(size * (1.0 - low_boost * 0.4))
+        swell_size = int(size * (1.0 - (q_boost / 16) * 0.4))
         swell_size = max(1, swell_size)
-
-        # 2. Color Shift logic
-        # We simulate 'global_brightness' using the current audio energy
-        # This makes nodes 'whiten' slightly during intense moments
-        white_mix = low_boost * 60  # Subtle white injection
-        current_color = (
-            min(255, int(self.color[0] + white_mix)),
-            min(255, int(self.color[1] + white_mix)),
-            min(255, int(self.color[2] + white_mix)),
-        )
-
-        # 3. Rendering with specific sober layers
         surf_dim = max(1, swell_size * 4)
-        note_surf = pygame.Surface((surf_dim, surf_dim), pygame.SRCALPHA)
 
-        # Large, very thin outer glow
-        pygame.draw.circle(note_surf, (*current_color, alpha // 8), (surf_dim // 2, surf_dim // 2), swell_size * 2)
+        # Quantize the alpha as well so that frames can share the same sprite
+        q_alpha = alpha & 0xF0
+        cache_key = (color, swell_size, q_alpha, q_boost)
+        cache = self._sober_node_cache
+        node_img = cache.get(cache_key)
+
+        if node_img is None:
+            # 2. Color Shift logic
+            # We simulate 'global_brightness' using the current audio energy
+            # This makes nodes 'whiten' slightly during intense moments
+            white_mix = (q_boost / 16) * 60  # Subtle white injection
+            current_color = (
+                min(255, int(color[0] + white_mix)),
+                min(255, int(color[1] + white_mix)),
+                min(255, int(color[2] + white_mix)),
+            )
+
+            # 3. Rendering with specific sober layers
+            note_surf = pygame.Surface((surf_dim, surf_dim), pygame.SRCALPHA)
+
+            # Large, very thin outer glow
+            pygame.draw.circle(
+                note_surf, (*current_color, q_alpha // 8), (surf_dim // 2, surf_dim // 2), swell_size * 2
+            )
 
-        # Solid core with precise scaling
-        pygame.draw.circle(
-            note_surf, (*current_color, alpha), (surf_dim // 2, surf_dim // 2), max(1, int(swell_size // 1.5))
-        )
+            # Solid core with precise scaling
+            pygame.draw.circle(
+                note_surf, (*current_color, q_alpha), (surf_dim // 2, surf_dim // 2), max(1, int(swell_size // 1.5))
+            )
 
-        surface.blit(note_surf, (x - surf_dim // 2, y - surf_dim // 2))
+            node_img = cache[cache_key] = note_surf.convert_alpha()
+            while len(cache) > self._SOBER_CACHE_MAX_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(cache_key)
+
+        dest = (x - surf_dim // 2, y - surf_dim // 2)
+        if blit_batch is None:
+            surface.blit(node_img, dest)
+        else:
+            blit_batch.append((node_img, dest))
@@ -1,10 +1,8 @@
-import math
-
 import pygame
 
 from note_dancer.visualization.base.audioviz import AudioVisualizationBase
 from note_dancer.visualization.base.hud import BooleanParameter, NumericParameter
-from note_dancer.visualization.radar.note_trace import NoteTrace
+from note_dancer.visualization.radar.note_trace import COS_LUT, LUT_SIZE, LUT_STEPS_PER_DEGREE, SIN_LUT, NoteTraces
 
 NEON_PALETTE = [
     (255, 0, 180),  # Magenta
@@ -53,14 +51,22 @@ class RadarVisualizer(AudioVisualizationBase):
 
         # --- State ---
         self.scanning_angle = 0.0
-        self.active_traces = []
+        self.active_traces = NoteTraces()
         self.ring_spacing = 22.0
 
+        # Ring radii before the bass 'duck', only recomputed when the inner radius or spacing changes
+        self._ring_geometry_key = None
+        self._ring_base_radii = ()
+
     def render_visualization(self, screen, font):
         events = self.process_audio_frame()
         if not events:
             return
 
+        # Loop invariants as locals (avoids repeated attribute lookups below)
+        center = self.center
+        notes = self.notes
+
         # 1. Apply Responsive Scaling
         sf = self.scale_factor
         scaled_inner_r = self.inner_radius.value * sf
@@ -71,7 +77,7 @@ class RadarVisualizer(AudioVisualizationBase):
         rotation_every_n_beats = 16 if self.half_rotation_speed.value else 8
         bps = events["bpm"] / 60.0
         degrees_per_frame = (360.0 * bps) / (60.0 * rotation_every_n_beats)
-        self.scanning_angle = (self.scanning_angle + degrees_per_frame) % 360
+        scanning_angle = self.scanning_angle = (self.scanning_angle + degrees_per_frame) % 360
 
         decay_rate = 255.0 / ((360.0 - 15.0) / max(0.01, degrees_per_frame))
 
@@ -87,56 +93,65 @@ class RadarVisualizer(AudioVisualizationBase):
         screen.fill((total_v, total_v, total_v + 8))
 
         # 4. Spawn Notes (Now using scaled values)
+        spawn = self.active_traces.spawn
         for note_idx in events["active_notes"]:
-            self.active_traces.append(
-                NoteTrace(
-                    note_idx,
-                    self.scanning_angle,
-                    self.notes[note_idx],  # 'energy' here is now a perfect logarithmic 0.0 to 1.0
-                    decay_rate,
-                    scaled_inner_r,
-                    scaled_spacing,
-                    scaled_node_size,
-                )
+            spawn(
+                note_idx,
+                scanning_angle,
+                notes[note_idx],  # 'energy' here is now a perfect logarithmic 0.0 to 1.0
+                decay_rate,
+                scaled_inner_r,
+                scaled_spacing,
+                scaled_node_size,
             )
 
         # 5. Draw Rings (Now using scaled values)
         if self.show_rings.value:
+            ring_geometry_key = (scaled_inner_r, scaled_spacing)
+            if ring_geometry_key != self._ring_geometry_key:
+                self._ring_base_radii = tuple(scaled_inner_r + (i * scaled_spacing) for i in range(12))
+                self._ring_geometry_key = ring_geometry_key
+
             duck = events["low"] * (30.0 * sf)  # Scale the movement too!
-            for i in range(12):
-                r = scaled_inner_r + (i * scaled_spacing) - duck
-                ring_bright = 40 + int(events["mid"] * 50)
-                # Thicker rings on larger screens
-                thickness = max(1, int(1 * sf))
-                pygame.draw.circle(
-                    screen, (ring_bright, ring_bright, ring_bright + 15), self.center, int(r), thickness
-                )
+            ring_bright = 40 + int(events["mid"] * 50)
+            ring_color = (ring_bright, ring_bright, ring_bright + 15)
+            # Thicker rings on larger screens
+            thickness = max(1, int(1 * sf))
+            draw_circle = pygame.draw.circle
+            for base_r in self._ring_base_radii:
+                draw_circle(screen, ring_color, center, int(base_r - duck), thickness)
 
         # 6. Update and Draw Particles
-        self.active_traces = [t for t in self.active_traces if t.update()]
+        self.active_traces.update()
         current_neon_color = NEON_PALETTE[int(self.neon_hue_idx.value)]
-        for t in self.active_traces:
-            t.draw(
-                screen,
-                self.center,
-                events["low"],
-                self.lag_comp.value,
-                self.note_style.value,
-                self.color_schema.value,
-                current_neon_color,
-            )
+        # Sprite-based styles are collected here and submitted with a single blits() call
+        blit_batch = []
+        self.active_traces.draw(
+            screen,
+            center,
+            events["low"],
+            self.lag_comp.value,
+            self.note_style.value,
+            self.color_schema.value,
+            current_neon_color,
+            blit_batch,
+        )
+        if blit_batch:
+            screen.blits(blit_batch, doreturn=False)
 
         # 7. Sweep Line (Scaled length)
-        rad = math.radians(self.scanning_angle - 90)
+        lut_idx = int(scanning_angle * LUT_STEPS_PER_DEGREE) % LUT_SIZE
         line_len = scaled_inner_r + (12 * scaled_spacing)
-        end_pos = (self.center[0] + line_len * math.cos(rad), self.center[1] + line_len * math.sin(rad))
+        end_pos = (center[0] + line_len * COS_LUT[lut_idx], center[1] + line_len * SIN_LUT[lut_idx])
 
         line_color = (255, 255, 255) if events["beat"] else (120, 150, 255)
-        pygame.draw.line(screen, line_color, self.center, end_pos, max(1, int(2 * sf)))
+        pygame.draw.line(screen, line_color, center, end_pos, max(1, int(2 * sf)))
 
         # 8. Store metrics for debug overlay
         self._active_traces_count = len(self.active_traces)
-        self._cache_size = len(NoteTrace._glowing_orb_cache)
+        self._cache_size = (
+            len(NoteTraces._glowing_orb_cache) + len(NoteTraces._sober_node_cache) + len(NoteTraces._segment_cache)
+        )
 
     def run(self):
         """Now calling the centralized run in Base class."""
@@ -1,6 +1,5 @@
 import collections
 import random
-import time
 
 import pygame
 
@@ -21,7 +20,9 @@ class SnakGame:
         self.reset()
 
     def reset(self):
-        self.snake = [(2, 5), (1, 5), (0, 5)]
+        # Body from head to tail, mirrored in a set for constant time collision checks
+        self.snake = collections.deque([(2, 5), (1, 5), (0, 5)])
+        self._snake_cells = set(self.snake)
         self.direction = (1, 0)
         self.next_direction = (1, 0)
         self.food_pos = self._spawn_food()
@@ -29,13 +30,13 @@ class SnakGame:
         self.just_ate = False
 
     def _spawn_food(self) -> tuple[int, int]:
-        while True:
-            pos = (random.randint(0, self.grid_size - 1), random.randint(0, self.grid_size - 1))
-            if pos not in self.snake:
-                return pos
+        # Pick among the free cells directly, retrying random positions slows down as the snake grows
+        size = self.grid_size
+        free_cells = [(x, y) for x in range(size) for y in range(size) if (x, y) not in self._snake_cells]
+        return random.choice(free_cells)
 
     def is_safe(self, x: int, y: int) -> bool:
-        return 0 <= x < self.grid_size and 0 <= y < self.grid_size and (x, y) not in self.snake
+        return 0 <= x < self.grid_size and 0 <= y < self.grid_size and (x, y) not in self._snake_cells
 
     def move(self) -> bool:
         self.just_ate = False
@@ -46,23 +47,31 @@ class SnakGame:
         if not self.is_safe(nx, ny):
             return False
 
-        self.snake.insert(0, (nx, ny))
+        self.snake.appendleft((nx, ny))
+        self._snake_cells.add((nx, ny))
         if (nx, ny) == self.food_pos:
             self.score += 1
+            if len(self.snake) == self.grid_size * self.grid_size:
+                # The board is full, there is no cell left for the food
+                return False
             self.food_pos = self._spawn_food()
             self.just_ate = True
         else:
-            self.snake.pop()
+            self._snake_cells.discard(self.snake.pop())
         return True
 
     def find_ai_move(self):
-        head = self.snake[0]
-        moves = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-        safe = [m for m in moves if self.is_safe(head[0] + m[0], head[1] + m[1])]
-        if not safe:
-            return None
-        safe.sort(key=lambda m: abs((head[0] + m[0]) - self.food_pos[0]) + abs((head[1] + m[1]) - self.food_pos[1]))
-        return safe[0]
+        hx, hy = self.snake[0]
+        fx, fy = self.food_pos
+        # Safe move closest to the food (Manhattan distance), the first one in this order wins ties
+        best_move, best_dist = None, None
+        for m in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+            nx, ny = hx + m[0], hy + m[1]
+            if self.is_safe(nx, ny):
+                dist = abs(nx - fx) + abs(ny - fy)
+                if best_dist is None or dist < best_dist:
+                    best_move, best_dist = m, dist
+        return best_move
 
 
 class SnakeVisualizer(AudioVisualizationBase):
@@ -73,12 +82,26 @@ class SnakeVisualizer(AudioVisualizationBase):
         self.offset_x = (self.width - (self.grid_size * self.cell_size)) // 2
         self.offset_y = (self.height - (self.grid_size * self.cell_size)) // 2
 
+        # Grid line end points, the layout is fixed so they are computed once
+        grid_extent = self.grid_size * self.cell_size
+        self._grid_lines = []
+        for i in range(self.grid_size + 1):
+            x_line = self.offset_x + i * self.cell_size
+            y_line = self.offset_y + i * self.cell_size
+            self._grid_lines.append(((x_line, self.offset_y), (x_line, self.offset_y + grid_extent)))
+            self._grid_lines.append(((self.offset_x, y_line), (self.offset_x + grid_extent, y_line)))
+
         self.game = SnakGame(self.grid_size)
 
         # Timing & State
         self.beat_count = 0
-        self.last_beat_time = 0
+        self.last_beat_ms = 0  # pygame.time.get_ticks() of the last beat
         self.flash_alpha = 0
+        # White full-screen overlay for the flash, only its alpha changes between frames
+        self._flash_surf: pygame.Surface | None = None
+        # Body segment colors, cached per (length, dance swap)
+        self._body_colors_key = None
+        self._body_colors = []
 
         # Breakback logic: buffer last 8 beats (2 bars in 4/4) to detect kick presence
         self.kick_history = collections.deque([True] * 8, maxlen=8)
@@ -100,7 +123,7 @@ class SnakeVisualizer(AudioVisualizationBase):
         # --- 1. Beat Processing ---
         if events["beat"]:
             self.beat_count += 1
-            self.last_beat_time = time.time()
+            self.last_beat_ms = pygame.time.get_ticks()
 
             # Update kick history for breakdown detection (wait for ~2 bars)
             self.kick_history.append(current_kick_active)
@@ -133,22 +156,18 @@ class SnakeVisualizer(AudioVisualizationBase):
 
         # Flash Effect
         if self.flash_alpha > 0:
-            flash_surf = pygame.Surface((self.width, self.height))
-            flash_surf.fill((255, 255, 255))
+            flash_surf = self._flash_surf
+            if flash_surf is None or flash_surf.get_size() != (self.width, self.height):
+                flash_surf = self._flash_surf = pygame.Surface((self.width, self.height))
+                flash_surf.fill((255, 255, 255))
             flash_surf.set_alpha(self.flash_alpha)
             screen.blit(flash_surf, (0, 0))
             self.flash_alpha = max(0, self.flash_alpha - 10)
 
         # Grid
-        for i in range(self.grid_size + 1):
-            x_line = self.offset_x + i * self.cell_size
-            y_line = self.offset_y + i * self.cell_size
-            pygame.draw.line(
-                screen, COLOR_GRID, (x_line, self.offset_y), (x_line, self.offset_y + self.grid_size * self.cell_size)
-            )
-            pygame.draw.line(
-                screen, COLOR_GRID, (self.offset_x, y_line), (self.offset_x + self.grid_size * self.cell_size, y_line)
-            )
+        draw_line = pygame.draw.line
+        for start, end in self._grid_lines:
+            draw_line(screen, COLOR_GRID, start, end)
 
         # --- 3. Dance Logic (Color Swap every 4th beat) ---
         dance_swap = self.is_in_breakdown and (self.beat_count // 4) % 2 == 1
@@ -176,28 +195,16 @@ class SnakeVisualizer(AudioVisualizationBase):
         pygame.draw.rect(screen, current_food_color, food_rect)
 
         # --- 5. Snake Rendering ---
-        time_since_beat = time.time() - self.last_beat_time
+        time_since_beat = (pygame.time.get_ticks() - self.last_beat_ms) * 0.001
         bounce = int(kick_val * 15 * max(0, 1.0 - (time_since_beat * 5.0)))
 
-        for i, (sx, sy) in enumerate(self.game.snake):
-            snake_rect = pygame.Rect(
-                self.offset_x + sx * self.cell_size + 4,
-                self.offset_y + sy * self.cell_size + 4 - bounce,
-                self.cell_size - 8,
-                self.cell_size - 8,
-            )
-
-            if i == 0:
-                color = current_snake_color
-            else:
-                fade = max(0.4, 1.0 - (i / len(self.game.snake)))
-                if dance_swap:
-                    # Fade the orange body
-                    color = (int(current_snake_color[0] * fade), int(current_snake_color[1] * fade), 0)
-                else:
-                    color = (int(100 * fade), int(100 * fade), int(100 * fade))
-
-            pygame.draw.rect(screen, color, snake_rect)
+        cell_size = self.cell_size
+        seg_x = self.offset_x + 4
+        seg_y = self.offset_y + 4 - bounce
+        seg_dim = cell_size - 8
+        body_colors = self._get_body_colors(len(self.game.snake), dance_swap, current_snake_color)
+        for color, (sx, sy) in zip(body_colors, self.game.snake):
+            screen.fill(color, (seg_x + sx * cell_size, seg_y + sy * cell_size, seg_dim, seg_dim))
 
         # HUD Info
         mode = "BREAKDOWN" if self.is_in_breakdown else "DRIVING"
@@ -205,6 +212,32 @@ class SnakeVisualizer(AudioVisualizationBase):
         info = font.render(f"SCORE: {self.game.score} | RATE: {speed_label} | {mode}", True, (120, 120, 120))
         screen.blit(info, (self.offset_x, self.offset_y - 35))
 
+    def _get_body_colors(self, length: int, dance_swap: bool, head_color: tuple[int, int, int]) -> list:
+        """
+        Segment colors from head to tail, they only change with the snake length and the dance swap.
+
+        Args:
+            length: Number of snake segments.
+            dance_swap: Whether the breakdown color swap is active.
+            head_color: Color of the head segment.
+
+        Returns:
+            One RGB tuple per segment.
+        """
+        key = (length, dance_swap)
+        if key != self._body_colors_key:
+            colors = [head_color]
+            for i in range(1, length):
+                fade = max(0.4, 1.0 - (i / length))
+                if dance_swap:
+                    # Fade the orange body
+                    colors.append((int(head_color[0] * fade), int(head_color[1] * fade), 0))
+                else:
+                    colors.append((int(100 * fade), int(100 * fade), int(100 * fade)))
+            self._body_colors = colors
+            self._body_colors_key = key
+        return self._body_colors
+
     def handle_keys(self, key: int) -> None:
         super().handle_keys(key)
 
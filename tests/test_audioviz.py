@@ -0,0 +1,69 @@
+import math
+import sys
+
+import pytest
+
+from note_dancer.visualization.base.audioviz import AudioVisualizationBase
+
+
+def hedge_bpm(raw_bpm: float) -> float:
+    # _hedge_bpm does not use any instance state
+    return AudioVisualizationBase._hedge_bpm(None, raw_bpm)
+
+
+def hedge_bpm_loop(raw_bpm: float) -> float:
+    """The original doubling/halving implementation, as the reference for finite positive input."""
+    if raw_bpm <= 0:
+        return 120.0
+    temp_bpm = raw_bpm
+    while temp_bpm < 90:
+        temp_bpm *= 2
+    while temp_bpm > 180:
+        temp_bpm /= 2
+    return temp_bpm
+
+
+@pytest.mark.parametrize("raw_bpm", [math.nan, math.inf, -math.inf, 0.0, -10.0])
+def test_hedge_bpm_invalid_input_falls_back(raw_bpm):
+    assert hedge_bpm(raw_bpm) == 120.0
+
+
+# The bounds shifted by whole octaves, exactly and one ulp outside, where log2 rounding can pick the wrong octave count
+BOUNDARY_BPMS = [
+    bpm
+    for k in range(40)
+    for bpm in (
+        90.0 * 2.0**-k,
+        math.nextafter(90.0 * 2.0**-k, 0.0),
+        180.0 * 2.0**k,
+        math.nextafter(180.0 * 2.0**k, math.inf),
+    )
+]
+
+
+@pytest.mark.parametrize(
+    "raw_bpm",
+    [
+        5e-324,
+        1e-310,
+        sys.float_info.min,
+        1e-300,
+        0.7,
+        11.25,
+        45.0,
+        89.9,
+        90.0,
+        128.0,
+        180.0,
+        180.1,
+        360.0,
+        1000.0,
+        1e300,
+        sys.float_info.max,
+        *BOUNDARY_BPMS,
+    ],
+)
+def test_hedge_bpm_matches_loop(raw_bpm):
+    result = hedge_bpm(raw_bpm)
+    assert result == hedge_bpm_loop(raw_bpm)
+    assert 90.0 <= result <= 180.0
@@ -0,0 +1,73 @@
+from collections import Counter
+
+import pytest
+
+from note_dancer.visualization.radar.note_trace import NoteTraces
+
+# Decay rates that survive one update() (life starts at 255) and ones that don't
+ALIVE, DEAD = 5.0, 300.0
+
+
+def spawn_all(decay_rates: list[float], capacity: int = 256) -> tuple[NoteTraces, list[tuple]]:
+    """Spawns one trace per decay rate with distinct per-trace values, returns them and their rows."""
+    traces = NoteTraces(capacity)
+    rows = []
+    for i, decay_rate in enumerate(decay_rates):
+        row = (i % 12, 10.0 * i, i / len(decay_rates), decay_rate, 100.0 + i, 20.0 + i, 5.0 + i)
+        traces.spawn(*row)
+        rows.append(row)
+    return traces, rows
+
+
+def live_rows(traces: NoteTraces) -> Counter:
+    """Multiset of (note_index, angle, energy, life, decay_rate, inner_r, spacing, max_size) rows."""
+    n = traces.count
+    columns = [getattr(traces, name)[:n].tolist() for name in NoteTraces._COLUMNS]
+    return Counter(zip(*columns))
+
+
+def expected_rows(rows: list[tuple]) -> Counter:
+    """Survivors of one update(), in the column order of NoteTraces._COLUMNS."""
+    expected = Counter()
+    for note_index, angle, energy, decay_rate, inner_r, spacing, max_size in rows:
+        life = 255.0 - decay_rate
+        if life > 0:
+            expected[(note_index, angle, energy, life, decay_rate, inner_r, spacing, max_size)] += 1
+    return expected
+
+
+@pytest.mark.parametrize(
+    "decay_rates",
+    [
+        [ALIVE] * 8,
+        [DEAD] * 8,
+        [ALIVE] * 5 + [DEAD] * 3,
+        [DEAD] * 3 + [ALIVE] * 5,
+        [DEAD, ALIVE, ALIVE, DEAD, ALIVE, DEAD, DEAD, ALIVE, ALIVE],
+    ],
+    ids=["none-dead", "all-dead", "tail-dead", "head-dead", "mixed"],
+)
+def test_update_keeps_exactly_the_survivors(decay_rates):
+    traces, rows = spawn_all(decay_rates)
+    traces.update()
+    assert len(traces) == sum(rate < 255.0 for rate in decay_rates)
+    assert live_rows(traces) == expected_rows(rows)
+
+
+def test_update_over_several_frames():
+    # Mixed decay rates die off on different frames, every frame is checked against the reference
+    decay_rates = [40.0, 100.0, 10.0, 130.0, 60.0, 255.0, 20.0, 90.0] * 4
+    traces, rows = spawn_all(decay_rates)
+    lives = [255.0] * len(rows)
+    for _ in range(10):
+        traces.update()
+        lives = [life - rate for life, rate in zip(lives, decay_rates)]
+        expected = Counter((row[0], row[1], row[2], life, *row[3:]) for row, life in zip(rows, lives) if life > 0)
+        assert live_rows(traces) == expected
+
+
+def test_spawn_grows_past_capacity():
+    traces, rows = spawn_all([ALIVE] * 10, capacity=4)
+    assert len(traces) == 10
+    traces.update()
+    assert live_rows(traces) == expected_rows(rows)
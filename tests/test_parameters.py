@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from note_dancer.visualization.base.parameters import sparkline_points
+
+RECT = (10, 20, 200, 40)  # x, y, w, h
+FULL_SCALE = 8.0
+
+
+def full_polyline(values) -> list[tuple[float, int]]:
+    """Every sample as a polyline point, the way the sparkline was drawn before points were dropped."""
+    x, y, w, h = RECT
+    n = len(values)
+    return [(x + i * (w / n), y + h - min(h, int(v / FULL_SCALE * h))) for i, v in enumerate(values)]
+
+
+def check_polyline(values) -> list:
+    points = [tuple(p) for p in sparkline_points(np.asarray(values, dtype=float), RECT, FULL_SCALE)]
+    full = full_polyline(values)
+
+    # Endpoints are kept, and the kept points are an in-order subset of the full polyline
+    assert points[0] == full[0] and points[-1] == full[-1]
+    kept = [full.index(p) for p in points]
+    assert kept == sorted(set(kept))
+
+    # Both ends of every change in height are kept
+    for i in range(1, len(full)):
+        if full[i][1] != full[i - 1][1]:
+            assert i - 1 in kept and i in kept
+
+    # Dropped points lie inside flat runs, so they don't change the drawn line
+    for a, b in zip(kept, kept[1:]):
+        assert all(full[j][1] == full[a][1] == full[b][1] for j in range(a + 1, b))
+    return points
+
+
+def test_flat_history_keeps_only_the_endpoints():
+    points = check_polyline([2.0] * 200)
+    assert len(points) == 2
+
+
+def test_single_spike():
+    values = [1.0] * 200
+    values[120] = 6.0
+    points = check_polyline(values)
+    # Start, the two corners before and after the spike, the spike itself, end
+    assert len(points) == 5
+
+
+def test_history_shorter_than_graph_width():
+    values = [0.0, 0.0, 3.0, 3.0, 3.0, 8.0, 12.0, 1.0, 1.0, 1.0]
+    points = check_polyline(values)
+    x, _, w, _ = RECT
+    assert points[1][0] == x + 1 * (w / len(values))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_random_histories(seed):
+    rng = np.random.default_rng(seed)
+    # Few distinct levels, so there are flat runs of varying length
+    check_polyline(rng.integers(0, 4, size=200) * 2.0)
+
+
+def test_two_samples():
+    check_polyline([0.0, 4.0])
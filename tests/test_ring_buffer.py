@@ -0,0 +1,48 @@
+from collections import deque
+
+import numpy as np
+import pytest
+
+from note_dancer.visualization.base.ring_buffer import RingBuffer
+
+SIZE = 5
+
+
+def filled(n_pushes: int, prefilled: bool = False) -> tuple[RingBuffer, deque]:
+    """A RingBuffer and the equivalent deque after pushing 1, 2, ..., n_pushes."""
+    ring = RingBuffer(SIZE, dtype=np.int64, prefilled=prefilled)
+    reference = deque([0] * SIZE if prefilled else [], maxlen=SIZE)
+    for value in range(1, n_pushes + 1):
+        ring.push(value)
+        reference.append(value)
+    return ring, reference
+
+
+@pytest.mark.parametrize(
+    "n_pushes",
+    [0, 1, SIZE - 1, SIZE, SIZE + 1, 2 * SIZE, 3 * SIZE + 2],
+    ids=["empty", "one", "before-wrap", "exactly-full", "first-wrap", "two-wraps", "several-wraps"],
+)
+def test_view_is_chronological(n_pushes):
+    ring, reference = filled(n_pushes)
+    assert ring.view().tolist() == list(reference)
+    assert len(ring) == len(reference) == min(n_pushes, SIZE)
+
+
+@pytest.mark.parametrize("n_pushes", [0, 1, SIZE - 1, SIZE, SIZE + 3, 4 * SIZE])
+def test_prefilled_starts_full_of_zeros(n_pushes):
+    ring, reference = filled(n_pushes, prefilled=True)
+    assert ring.view().tolist() == list(reference)
+    assert len(ring) == SIZE
+
+
+def test_view_before_wrap_is_not_a_copy():
+    ring, _ = filled(SIZE - 1)
+    assert np.shares_memory(ring.view(), ring.buf)
+
+
+def test_dtype_is_kept():
+    ring = RingBuffer(3, dtype=np.float64)
+    ring.push(0.1)
+    assert ring.view().dtype == np.float64
+    assert ring.view()[0] == 0.1